@@ -175,6 +175,18 @@ class DatabaseManager:
             self.conn.rollback()
             return False
     
+    def changed_project_fields(self, updates: Dict, current: Optional[Dict]) -> Dict:
+        """Subset of updates that differs from current (a get_project() record).
+        
+        Paths are compared in their stored (relative) form, so an unchanged project
+        reduces to a last_accessed-only UPDATE in update_project.
+        """
+        if not current:
+            return dict(updates)
+        new = self._serialize_project_data(updates)
+        old = self._serialize_project_data({key: current.get(key) for key in updates})
+        return {key: value for key, value in updates.items() if new[key] != old[key]}
+    
     def get_project(self, cabinet_id: str) -> Optional[Dict]:
         """Get project by cabinet ID"""
         self.cursor.execute("""
@@ -272,6 +284,18 @@ class DatabaseManager:
         
         return [self._resolve_project_record(dict(row)) for row in self.cursor.fetchall()]
     
+    def get_recent_project_labels(self, limit: int = 20) -> List[Tuple[str, str]]:
+        """Get (cabinet_id, project_name) of recent projects, newest first"""
+        self.cursor.execute("""
+            SELECT p.cabinet_id, p.project_name
+            FROM projects p
+            INNER JOIN recent_projects r ON p.cabinet_id = r.cabinet_id
+            ORDER BY r.last_accessed DESC
+            LIMIT ?
+        """, (limit,))
+        
+        return [(row[0], row[1]) for row in self.cursor.fetchall()]
+    
     def clear_old_recent_projects(self, days: int = 7):
         """Clear recent projects older than specified days"""
         cutoff_date = datetime.now().timestamp() - (days * 24 * 60 * 60)
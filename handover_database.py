@@ -82,10 +82,15 @@ class HandoverDB:
     # QUALITY TO PRODUCTION HANDOVER
     # ================================================================
     
-    def add_quality_handover(self, handover_data: dict) -> bool:
+    def add_quality_handover(self, handover_data: dict, rework_verified_by: str = None,
+                             rework_notes: str = None) -> bool:
         """
         Add a new Quality -> Production handover
         
+        If rework_verified_by is given, a pending rework item for the cabinet is marked
+        'verified' in the same transaction (what verify_production_item() would do), so
+        a handover costs one connection and one commit.
+        
         Args:
             handover_data: Dict containing:
                 - cabinet_id: str
@@ -99,6 +104,8 @@ class HandoverDB:
                 - closed_punches: int
                 - handed_over_by: str
                 - handed_over_date: str (ISO format)
+            rework_verified_by: Username recorded when clearing the rework queue
+            rework_notes: Verification notes for the cleared rework item
         
         Returns:
             bool: True if successful, False if already exists
@@ -109,6 +116,21 @@ class HandoverDB:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
+            if rework_verified_by is not None:
+                # No-op when the cabinet isn't in the rework queue
+                now = datetime.now().isoformat()
+                cursor.execute('''
+                    UPDATE production_to_quality
+                    SET status = 'verified',
+                        verified_by = ?,
+                        verified_date = ?,
+                        verification_notes = ?,
+                        updated_at = ?
+                    WHERE cabinet_id = ? AND status = 'pending'
+                ''', (rework_verified_by, now, rework_notes, now, handover_data['cabinet_id']))
+                if cursor.rowcount > 0:
+                    print(f" Production item verified: {handover_data['cabinet_id']} -> verified")
+            
             # Check if already handed over (pending or in_progress)
             cursor.execute('''
                 SELECT id FROM quality_to_production
@@ -118,6 +140,7 @@ class HandoverDB:
             existing = cursor.fetchone()
             
             if existing:
+                conn.commit()  # keep the rework-queue update
                 conn.close()
                 return False  # Already in production queue
             
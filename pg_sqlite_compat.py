@@ -11,6 +11,7 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from typing import Iterable, Optional, Sequence
 
 try:
@@ -291,6 +292,8 @@ def _rewrite_add_column_if_not_exists(sql: str) -> str:
     return f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column_clause}"
 
 
+# Callers pass a small, fixed set of statement strings; translate each once
+@lru_cache(maxsize=256)
 def _transform_sql(sql: str) -> str:
     transformed = sql
 
@@ -1151,6 +1151,14 @@ class ProductionTool:
         
         pos = [0]
         
+        def find_ann(p):
+            # Plain loop: no generator frame per annotation, first match wins
+            sr, row = p['sr_no'], p['row']
+            for a in self.annotations:
+                if a.get('sr_no') == sr or a.get('excel_row') == row:
+                    return a
+            return None
+        
         def show_item():
             p = punches[pos[0]]
             
@@ -1173,9 +1181,7 @@ class ProductionTool:
             text_widget.insert(tk.END, f"Implementation: {'YES' if p['implemented'] else 'NO'}\n")
             
             # Find annotation - checks for both SR number and excel row
-            ann = next((a for a in self.annotations 
-                       if a.get('sr_no') == p['sr_no'] 
-                       or a.get('excel_row') == p['row']), None)
+            ann = find_ann(p)
             
             # Display quality remarks from quality team
             if ann and ann.get('quality_remark'):
@@ -1232,9 +1238,7 @@ class ProductionTool:
                 return
             
             # Find annotation and update implementation status
-            ann = next((a for a in self.annotations 
-                       if a.get('sr_no') == p['sr_no'] 
-                       or a.get('excel_row') == p['row']), None)
+            ann = find_ann(p)
             
             if ann:
                 ann['implemented'] = True
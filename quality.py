@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, Menu
+import tkinter.font as tkfont
 from PIL import Image, ImageTk, ImageDraw, ImageFont,ImageEnhance,ImageFilter
 import fitz  
 from openpyxl import load_workbook
@@ -14,9 +15,27 @@ import numpy as np
 import getpass
 import sys
 import subprocess
+import threading
+import queue
+import weakref
+import logging
+import logging.handlers
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 import pg_sqlite_compat as sqlite3
 import shlex
 from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:  # optional; difflib is the fallback
+    _rf_fuzz = _rf_process = None
+try:
+    from python_calamine import CalamineWorkbook as _CalamineWorkbook
+except ImportError:  # optional; openpyxl is the fallback
+    _CalamineWorkbook = None
 from handover_database import HandoverDB
 from database_manager import DatabaseManager
 from category_store_pg import load_categories_from_postgres
@@ -28,10 +47,7 @@ from path_policy import (
     to_relative_storage_location,
 )
 from tkinter import ttk
-import pytesseract
 import os
-import cv2
-import io
 import re
 import sys
 import filedialog_compat as filedialog
@@ -41,6 +57,8 @@ Name = sys.argv[2] if len(sys.argv) > 2 else None
 
 def configure_tesseract_cmd():
     """Resolve Tesseract executable from env, PATH, and common install locations."""
+    import pytesseract
+
     env_candidates = [
         os.environ.get("TESSERACT_CMD"),
         os.environ.get("TESSERACT_PATH"),
@@ -67,12 +85,119 @@ def configure_tesseract_cmd():
     return None
 
 
-TESSERACT_CMD = configure_tesseract_cmd()
-if TESSERACT_CMD:
-    print(f"[INFO] OCR engine path: {TESSERACT_CMD}")
-else:
-    print("[WARN] Tesseract was not found. Install it and add to PATH or set TESSERACT_CMD.")
-    
+TESSERACT_CMD = None
+_tesseract_ready = False
+_tesseract_lock = threading.Lock()
+
+
+def get_pytesseract():
+    """Import pytesseract and resolve the OCR binary on first use, not at startup."""
+    global TESSERACT_CMD, _tesseract_ready
+    import pytesseract
+
+    with _tesseract_lock:
+        if not _tesseract_ready:
+            TESSERACT_CMD = configure_tesseract_cmd()
+            _tesseract_ready = True
+            if TESSERACT_CMD:
+                print(f"[INFO] OCR engine path: {TESSERACT_CMD}")
+            else:
+                print("[WARN] Tesseract was not found. Install it and add to PATH or set TESSERACT_CMD.")
+    return pytesseract
+
+
+def _warm_ocr_engine():
+    """Load the OCR stack ahead of the first annotation OCR."""
+    try:
+        get_pytesseract()
+        import cv2  # noqa: F401
+    except Exception as e:
+        print(f"[WARN] OCR warm-up failed: {e}")
+
+
+# Background sync/status messages; main() routes them through start_log_listener()
+logger = logging.getLogger("quality")
+
+
+def start_log_listener():
+    """
+    Send this module's log records through a queue to a listener thread that does the
+    console writes, so logging from the Tk thread or the sync worker is only a queue put.
+    Returns the listener (stop() flushes it), or None if handlers are already set up.
+    """
+    if logger.handlers:
+        return None
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+
+_CELL_REF_RE = re.compile(r"([A-Z]+)(\d+)")
+
+
+@lru_cache(maxsize=256)
+def split_cell_ref(cell_ref):
+    """Parse an Excel reference like 'B5' into (5, 'B'); memoized since refs repeat."""
+    m = _CELL_REF_RE.match(cell_ref)
+    if not m:
+        raise ValueError(f"Invalid cell reference: {cell_ref}")
+    col, row = m.groups()
+    return int(row), col
+
+
+# Interphase ref cells are "5" or ranges like "1-2"; the number after the last dash counts
+_INTERPHASE_REF_RE = re.compile(r"(?:.*-)?\s*\+?(\d+)\s*", re.S)
+
+# Highest completed Interphase ref -> status: 1-2, 3-9, 10-18, 19-26, 27+
+_STATUS_BOUNDS = (2, 9, 18, 26)
+_STATUS_NAMES = ('project_info_sheet', 'mechanical_assembly', 'component_assembly',
+                 'final_assembly', 'final_documentation')
+
+
+def interphase_ref_num(value):
+    """Reference number of an Interphase ref cell (last number of a range), or None."""
+    m = _INTERPHASE_REF_RE.fullmatch(str(value))
+    return int(m.group(1)) if m else None
+
+
+def interphase_status_for(highest_ref_num):
+    """Workflow status for the highest Interphase ref that has a status filled in."""
+    if highest_ref_num <= 0:
+        return 'quality_inspection'  # Nothing completed yet
+    return _STATUS_NAMES[bisect_left(_STATUS_BOUNDS, highest_ref_num)]
+
+
+def clone_file(src, dst):
+    """
+    Copy src to dst with metadata, like shutil.copy2, letting the kernel share blocks where it can.
+    copy_file_range() reflinks on CoW filesystems (btrfs, XFS) and copies in-kernel elsewhere;
+    platforms without it fall back to shutil.copy2. A hardlink is not used because the working
+    Excel is saved in place later and would rewrite the snapshot with it.
+    """
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
 def app_base():
     """
     Returns the directory where the app is running from.
@@ -107,6 +232,57 @@ class ManagerDB:
     """Manager database integration with storage_location and excel_path support"""
     def __init__(self, db_path):
         self.db_path = db_path
+        # One server connection is reused for every call; the stats worker and
+        # the UI thread take turns on it through the lock
+        self._conn = None
+        self._conn_lock = threading.RLock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Yield the shared manager DB connection, opening it on first use.
+        Commits when the block succeeds and rolls back when it raises. A connection
+        that cannot even roll back is dropped so the next call reconnects.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(self.db_path)
+            conn = self._conn
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                try:
+                    conn.rollback()
+                except Exception:
+                    self._discard_connection()
+                raise
+
+    def _discard_connection(self):
+        """Close and forget the shared connection (caller holds the lock)."""
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Close the shared connection, e.g. when the application exits."""
+        with self._conn_lock:
+            self._discard_connection()
+
+    def __getstate__(self):
+        """Copies/pickles open their own connection."""
+        state = self.__dict__.copy()
+        state.pop('_conn', None)
+        state.pop('_conn_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._conn = None
+        self._conn_lock = threading.RLock()
 
     def splitcell(self, cell_ref):
         """
@@ -115,12 +291,7 @@ class ManagerDB:
         Args: cell_ref - Cell reference string (e.g., 'B5', 'H10')
         Returns: Tuple of (row_number, column_letter)
         """
-        import re
-        m = re.match(r"([A-Z]+)(\d+)", cell_ref)
-        if not m:
-            raise ValueError(f"Invalid cell reference: {cell_ref}")
-        col, row = m.groups()
-        return int(row), col
+        return split_cell_ref(cell_ref)
 
     def mergedtar(self, ws, row, col_idx):
         """
@@ -143,8 +314,6 @@ class ManagerDB:
         Args: ws - Worksheet, row - row number, col - column (letter or index)
         Returns: Cell value (string, number, date, etc.)
         """
-        from openpyxl.utils import column_index_from_string
-        
         if isinstance(col, str):
             col_idx = column_index_from_string(col)
         else:
@@ -152,78 +321,6 @@ class ManagerDB:
         target_row, target_col = self.mergedtar(ws, int(row), col_idx)
         return ws.cell(row=target_row, column=target_col).value
 
-    def interphase_status(self, excel_path):
-        """
-        Determine cabinet status by reading highest reference number in Interphase sheet.
-        FUNCTIONAL USE: Reads Interphase worksheet to calculate assembly progress.
-        Maps highest filled reference to status (assembly_in_progress, assembly_complete, final_check, etc.).
-        Used by quality inspection to track assembly completion stage.
-        Args: excel_path - Full path to Excel file
-        Returns: Status string or None if not determined from Interphase
-        """
-        if not excel_path or not os.path.exists(excel_path):
-            return None
-        
-        try:
-            from openpyxl import load_workbook
-            wb = load_workbook(excel_path, data_only=True)
-            
-            if 'Interphase' not in wb.sheetnames:
-                wb.close()
-                return None
-            
-            ws = wb['Interphase']
-            
-            # Find the HIGHEST reference number that has a status
-            highest_ref_num = 0
-            
-            # Start from row 11 (typical Interphase data starts here)
-            for row in range(11, ws.max_row + 1):
-                status_cell = self.read(ws, row, 'D')  # Status column
-                
-                # If status cell has content, check the reference number
-                if status_cell and str(status_cell).strip():
-                    ref_no_cell = self.read(ws, row, 'B')  # Reference column
-                    
-                    if ref_no_cell:
-                        try:
-                            ref_str = str(ref_no_cell).strip()
-                            
-                            # Handle range formats like "1-2" - take the LAST number
-                            if '-' in ref_str:
-                                ref_num = int(ref_str.split('-')[-1])
-                            else:
-                                ref_num = int(ref_str)
-                            
-                            # Track highest completed reference
-                            if ref_num > highest_ref_num:
-                                highest_ref_num = ref_num
-                        
-                        except (ValueError, IndexError):
-                            continue
-            
-            wb.close()
-            
-            # Determine status based on highest completed reference number
-            if highest_ref_num == 0:
-                return 'quality_inspection'  # Nothing completed yet
-            elif 1 <= highest_ref_num <= 2:
-                return 'project_info_sheet'
-            elif 3 <= highest_ref_num <= 9:
-                return 'mechanical_assembly'
-            elif 10 <= highest_ref_num <= 18:
-                return 'component_assembly'
-            elif 19 <= highest_ref_num <= 26:
-                return 'final_assembly'
-            elif highest_ref_num >= 27:
-                return 'final_documentation'
-            else:
-                return 'quality_inspection'
-            
-        except Exception as e:
-            print(f"Error reading Interphase worksheet: {e}")
-            return None
-    
     def updatecab(self, cabinet_id, project_name, sales_order_no, 
                       total_pages, annotated_pages, total_punches, 
                       open_punches, implemented_punches, closed_punches, status,
@@ -237,26 +334,25 @@ class ManagerDB:
         try:
             storage_location_db = to_relative_storage_location(storage_location)
             excel_path_db = to_relative_path(excel_path)
+            now = datetime.now().isoformat()
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO cabinets 
-                (cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
-                 total_punches, open_punches, implemented_punches, closed_punches, status,
-                 storage_location, excel_path,
-                 created_date, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                        COALESCE((SELECT created_date FROM cabinets WHERE cabinet_id = ?), ?),
-                        ?)
-            ''', (cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
-                  total_punches, open_punches, implemented_punches, closed_punches, status,
-                storage_location_db, excel_path_db,
-                  cabinet_id, datetime.now().isoformat(), datetime.now().isoformat()))
-            
-            conn.commit()
-            conn.close()
+            with self.connection() as conn:
+                cursor = conn.cursor()
+            
+                cursor.execute('''
+                    INSERT OR REPLACE INTO cabinets 
+                    (cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
+                     total_punches, open_punches, implemented_punches, closed_punches, status,
+                     storage_location, excel_path,
+                     created_date, last_updated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                            COALESCE((SELECT created_date FROM cabinets WHERE cabinet_id = ?), ?),
+                            ?)
+                ''', (cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
+                      total_punches, open_punches, implemented_punches, closed_punches, status,
+                    storage_location_db, excel_path_db,
+                      cabinet_id, now, now))
+            
             return True
         except Exception as e:
             print(f"Manager DB update error: {e}")
@@ -270,17 +366,15 @@ class ManagerDB:
         Args: cabinet_id, project_name, category, subcategory - Metadata for occurrence
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                INSERT INTO category_occurrences 
-                (cabinet_id, project_name, category, subcategory, occurrence_date)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (cabinet_id, project_name, category, subcategory, datetime.now().isoformat()))
+                cursor.execute('''
+                    INSERT INTO category_occurrences 
+                    (cabinet_id, project_name, category, subcategory, occurrence_date)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (cabinet_id, project_name, category, subcategory, datetime.now().isoformat()))
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Category logging error: {e}")
@@ -293,17 +387,15 @@ class ManagerDB:
         Updates database with current date/time to track inspection progress.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            cursor.execute('''
-                UPDATE cabinets 
-                SET status = ?, last_updated = ?
-                WHERE cabinet_id = ?
-            ''', (status, datetime.now().isoformat(), cabinet_id))
+                cursor.execute('''
+                    UPDATE cabinets 
+                    SET status = ?, last_updated = ?
+                    WHERE cabinet_id = ?
+                ''', (status, datetime.now().isoformat(), cabinet_id))
             
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             print(f"Status update error: {e}")
@@ -312,20 +404,19 @@ class ManagerDB:
     def fetchcab(self, cabinet_id):
         """Get cabinet information"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
-                       total_punches, open_punches, implemented_punches, closed_punches, status,
-                       storage_location, excel_path, created_date, last_updated
-                FROM cabinets 
-                WHERE cabinet_id = ?
-            ''', (cabinet_id,))
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            row = cursor.fetchone()
-            conn.close()
+                cursor.execute('''
+                    SELECT cabinet_id, project_name, sales_order_no, total_pages, annotated_pages,
+                           total_punches, open_punches, implemented_punches, closed_punches, status,
+                           storage_location, excel_path, created_date, last_updated
+                    FROM cabinets 
+                    WHERE cabinet_id = ?
+                ''', (cabinet_id,))
             
+                row = cursor.fetchone()
+
             if row:
                 return {
                     'cabinet_id': row[0],
@@ -351,6 +442,92 @@ class ManagerDB:
 
 
 class CircuitInspector:
+    # Discrete zoom steps used by zoomin/zoomout
+    _ZOOM_LEVELS = (0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0)
+
+    # Parsed workbooks kept in _wb_cache
+    _WB_CACHE_SIZE = 4
+
+    # Checklist review writes a checkpoint save after this many edits
+    _REVIEW_SAVE_EVERY = 10
+
+    # Punch closing writes a checkpoint save after this many closures
+    _PUNCH_SAVE_EVERY = 10
+
+    # First punch row of the Punch Sheet. The header spans rows 7-8 and its SR No cell
+    # is merged (A7:A8), so a values-only sweep reads A8 as None; sweeps start below it
+    _PUNCH_FIRST_ROW = 9
+
+    # Seconds onclosing() waits for queued stats/status writes before closing anyway
+    _SYNC_CLOSE_TIMEOUT = 15
+
+    # Statuses that still follow the Interphase sheet on a stats sync; anything
+    # later (handover, closing, ...) was set explicitly and is left alone
+    _WORKFLOW_STATUSES = (
+        'project_info_sheet',
+        'mechanical_assembly',
+        'component_assembly',
+        'final_assembly',
+        'final_documentation',
+        'quality_inspection',
+    )
+
+    # The stats worker's upsert (see _write_manager_stats), built once so the same
+    # statement text, and its cached translation in pg_sqlite_compat, is reused
+    _CABINET_UPSERT_SQL = f'''
+        INSERT INTO cabinets (
+            cabinet_id, project_name, sales_order_no,
+            total_pages, annotated_pages, total_punches,
+            open_punches, implemented_punches, closed_punches,
+            status, created_date, last_updated,
+            storage_location, excel_path
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (cabinet_id) DO UPDATE SET
+            total_pages = EXCLUDED.total_pages,
+            annotated_pages = EXCLUDED.annotated_pages,
+            total_punches = EXCLUDED.total_punches,
+            open_punches = EXCLUDED.open_punches,
+            implemented_punches = EXCLUDED.implemented_punches,
+            closed_punches = EXCLUDED.closed_punches,
+            status = COALESCE(
+                ?,
+                CASE WHEN cabinets.status IN ({", ".join("?" * len(_WORKFLOW_STATUSES))}) THEN ? END,
+                cabinets.status),
+            last_updated = EXCLUDED.last_updated,
+            excel_path = EXCLUDED.excel_path,
+            storage_location = EXCLUDED.storage_location
+        RETURNING status, (xmax = 0)
+    '''
+
+    # Interphase statuses that count as checked
+    _DONE_STATUSES = frozenset(('ok', 'nok', 'n/a', 'na', 'not applicable'))
+
+    # Toolbar button styles, built once rather than copied per uisetup()
+    _BTN_STYLE = {
+        'bg': '#3b82f6',
+        'fg': 'white',
+        'padx': 12,
+        'pady': 10,
+        'font': ('Segoe UI', 9, 'bold'),
+        'relief': tk.FLAT,
+        'borderwidth': 0,
+        'cursor': 'hand2'
+    }
+    _NAV_BTN_STYLE = {**_BTN_STYLE, 'bg': '#64748b'}
+    _ZOOM_BTN_STYLE = {**_BTN_STYLE, 'bg': '#10b981'}
+    _VERIFY_BTN_STYLE = {**_BTN_STYLE, 'bg': '#ec4899'}
+    _HANDOVER_BTN_STYLE = {**_BTN_STYLE, 'bg': '#8b5cf6'}
+
+    # Punch-closing dialog buttons; the font comes from self._fonts (needs a Tk root)
+    _PUNCH_BTN_STYLE = {
+        'relief': tk.FLAT,
+        'borderwidth': 0,
+        'cursor': 'hand2',
+        'padx': 35,
+        'pady': 18,
+        'width': 15
+    }
+
     def __init__(self, root):
         self.root = root
         self.logged_in_username = User
@@ -368,14 +545,26 @@ class CircuitInspector:
         self.project_name = ""
         self.sales_order_no = ""
         self.cabinet_id = ""
-        self.annotations = []
+        self._reset_annotations()
         base = app_base()
         self.master_excel_file = os.path.join(base, "Emerson.xlsx")
 
         self.excel_file = None
+        self._wb_cache = OrderedDict()  # (abspath, data_only) -> (stat key, Workbook)
+        self._xl_lock = threading.RLock()  # guards _wb_cache; excelbg() workers read it too
+        self._wb_base_stat = weakref.WeakKeyDictionary()  # editable Workbook -> stat it matches
+        self._sync_queue = queue.Queue()  # stats snapshots for _sync_worker
+        self._sync_thread = None
+        self._last_sync_key = None  # inputs of the last queued sync; cleared if the write fails
+        self._punches_cache = {}  # abspath -> (stat key, open punches from openpuches())
+        self._punch_desc_cache = {}  # abspath -> (stat key, punchindex() result)
+        self._interphase_status_cache = {}  # abspath -> (stat key, get_status_from_interphase() result)
+        self._open_count_cache = {}  # abspath -> (stat key, countopen() result)
         self.working_excel_path = None
         self.checklist_file = self.excel_file
         self.zoom_level = 1.0
+        self._zoom_matrices = {}  # zoom_level -> fitz.Matrix
+        self._ocr_warmup = None  # background thread preloading the OCR stack
         self.current_sr_no = 1
         self.current_page_image = None
         self.tool_mode = None  # None, "pen", or "text"
@@ -397,6 +586,8 @@ class CircuitInspector:
             'closed_name': 'I',
             'closed_date': 'J'
         }
+        # 0-based offsets into a values_only row tuple, parsed from the letters once
+        self._punch_col_idx = {k: column_index_from_string(v) - 1 for k, v in self.punch_cols.items()}
         
         self.interphase_sheet_name = 'Interphase'
         self.interphase_cols = {
@@ -420,6 +611,11 @@ class CircuitInspector:
                 "cabinet_id": "H4"
             }
         }
+        # Same map parsed to (row, col) once
+        self._header_cells_rc = {
+            sheet: {k: split_cell_ref(v) for k, v in cells.items()}
+            for sheet, cells in self.header_cells.items()
+        }
 
         self.categories = []
         self.category_file = os.path.join(os.path.dirname(app_base()), "assets", "categories.json")
@@ -433,6 +629,7 @@ class CircuitInspector:
             'yellow': {'rgb': (255, 255, 0), 'rgba': (255, 255, 0, 80), 'name': 'Wiring '}
         }
         self.current_color_key = 'yellow'  # Default color
+        self._color_menu = None  # built on first colourmenu() call
         self.highlight_points = []
 
         # Drawing / tool state
@@ -444,6 +641,27 @@ class CircuitInspector:
         self.max_undo = 50    # Maximum undo history
         self.hover_annotation = None  # For hover preview
 
+        # Reusable flash-status label (shown/hidden instead of recreated)
+        self._status_lbl = tk.Label(self.root, text='', fg='white',
+                                    font=('Segoe UI', 10, 'bold'),
+                                    padx=25, pady=12, relief=tk.FLAT)
+        self._status_lbl.place_forget()
+        self._status_after_id = None
+        self._display_pending = False
+
+        # Named fonts for dialogs that are rebuilt often; one Tcl font each instead of
+        # resolving a font tuple per widget
+        self._fonts = {
+            'title_13': tkfont.Font(root=self.root, family='Segoe UI', size=13, weight='bold'),
+            'bold_12': tkfont.Font(root=self.root, family='Segoe UI', size=12, weight='bold'),
+            'bold_10': tkfont.Font(root=self.root, family='Segoe UI', size=10, weight='bold'),
+            'bold_9': tkfont.Font(root=self.root, family='Segoe UI', size=9, weight='bold'),
+            'text_10': tkfont.Font(root=self.root, family='Segoe UI', size=10),
+            'label_8': tkfont.Font(root=self.root, family='Segoe UI', size=8),
+        }
+        self._stats_sync_after_id = None
+        self._punch_dlg = None  # pooled punch-closing window, see _build_punch_dialog()
+
         self.uisetup()
         self.current_sr_no = self.getnextsr()
         
@@ -681,7 +899,7 @@ class CircuitInspector:
                     self.errorhighlight(annotation)
                 else:
                     # Green/Yellow highlighters - no OCR, just add annotation
-                    self.annotations.append(annotation)
+                    self._add_ann(annotation)
                     self.addtostack('add_annotation', annotation)
                     self.display()
             
@@ -702,7 +920,7 @@ class CircuitInspector:
                     'points': points_page,
                     'timestamp': datetime.now().isoformat()
                 }
-                self.annotations.append(annotation)
+                self._add_ann(annotation)
                 self.addtostack('add_annotation', annotation)
             self.pen_points = []
             self.cleartemp()
@@ -724,7 +942,7 @@ class CircuitInspector:
                     'text': txt.strip(),
                     'timestamp': datetime.now().isoformat()
                 }
-                self.annotations.append(annotation)
+                self._add_ann(annotation)
                 self.addtostack('add_annotation', annotation)
                 self.display()
             self.drawing = False
@@ -772,6 +990,8 @@ class CircuitInspector:
             return None
         
         try:
+            import cv2
+
             bbox_page = annotation.get('bbox_page')
             if not bbox_page:
                 return None
@@ -905,6 +1125,8 @@ class CircuitInspector:
         Returns: Tuple of (extracted_text, average_confidence_percent)
         """
         try:
+            pytesseract = get_pytesseract()
+
             # Get OCR data with confidence scores
             ocr_data = pytesseract.image_to_data(
                 pil_image, 
@@ -983,6 +1205,8 @@ class CircuitInspector:
             return None
         
         try:
+            import cv2
+
             bbox_page = annotation.get('bbox_page')
             if not bbox_page:
                 return None
@@ -1029,7 +1253,7 @@ class CircuitInspector:
             
             # OCR
             pil_img = Image.fromarray(binary)
-            text = pytesseract.image_to_string(pil_img, lang='eng', config='--psm 6')
+            text = get_pytesseract().image_to_string(pil_img, lang='eng', config='--psm 6')
             
             # Clean
             text = ' '.join(text.split()).strip()
@@ -1061,6 +1285,8 @@ class CircuitInspector:
         Args: pil_image - PIL Image object
         Returns: PIL Image - Preprocessed and ready for OCR
         """
+        import cv2
+
         # Convert to numpy array
         img_array = np.array(pil_image)
         
@@ -1298,20 +1524,17 @@ class CircuitInspector:
         self.session_refs.add(ref_no)
 
         try:
-            wb = load_workbook(self.excel_file)
+            wb = self.openworkingxl()
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
 
-            row_num = 8
-            while True:
-                val = self.readcell(ws, row_num, self.punch_cols['sr_no'])
+            row_num = self._PUNCH_FIRST_ROW
+            prev_sr = None
+            for val in self.colvalues(ws, self.punch_cols['sr_no'], self._PUNCH_FIRST_ROW):
                 if val is None:
                     break
+                prev_sr = val
                 row_num += 1
 
-            prev_sr = None
-            if row_num > 8:
-                prev_sr = self.readcell(ws, row_num - 1, self.punch_cols['sr_no'])
-
             try:
                 sr_no_assigned = int(prev_sr) + 1 if prev_sr is not None else 1
             except:
@@ -1329,8 +1552,7 @@ class CircuitInspector:
             self.writecell(ws, row_num, self.punch_cols['checked_date'], 
                           datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-            wb.save(self.excel_file)
-            wb.close()
+            self.saveworkingxl(wb)
 
             updated = self.updatestatsforref(ref_no, status='NOK')
             if updated:
@@ -1349,7 +1571,7 @@ class CircuitInspector:
             annotation['implementation_remark'] = None
 
             # Add to annotations list
-            self.annotations.append(annotation)
+            self._add_ann(annotation)
             self.current_sr_no = self.getnextsr()
             
             # Redraw to show the color change from orange to red
@@ -1399,20 +1621,17 @@ class CircuitInspector:
         self.session_refs.add(ref_no)
 
         try:
-            wb = load_workbook(self.excel_file)
+            wb = self.openworkingxl()
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
 
-            row_num = 8
-            while True:
-                val = self.readcell(ws, row_num, self.punch_cols['sr_no'])
+            row_num = self._PUNCH_FIRST_ROW
+            prev_sr = None
+            for val in self.colvalues(ws, self.punch_cols['sr_no'], self._PUNCH_FIRST_ROW):
                 if val is None:
                     break
+                prev_sr = val
                 row_num += 1
 
-            prev_sr = None
-            if row_num > 8:
-                prev_sr = self.readcell(ws, row_num - 1, self.punch_cols['sr_no'])
-
             try:
                 sr_no_assigned = int(prev_sr) + 1 if prev_sr is not None else 1
             except:
@@ -1430,8 +1649,7 @@ class CircuitInspector:
             self.writecell(ws, row_num, self.punch_cols['checked_date'], 
                           datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-            wb.save(self.excel_file)
-            wb.close()
+            self.saveworkingxl(wb)
 
             updated = self.updatestatsforref(ref_no, status='NOK')
             if updated:
@@ -1448,7 +1666,7 @@ class CircuitInspector:
             annotation['implemented_date'] = None
             annotation['implementation_remark'] = None
 
-            self.annotations.append(annotation)
+            self._add_ann(annotation)
             self.current_sr_no = self.getnextsr()
             self.display()
 
@@ -1509,20 +1727,17 @@ class CircuitInspector:
             ref_no = str(ref_no).strip()
             self.session_refs.add(ref_no)
 
-            wb = load_workbook(self.excel_file)
+            wb = self.openworkingxl()
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
 
-            row_num = 8
-            while True:
-                val = self.readcell(ws, row_num, self.punch_cols['sr_no'])
+            row_num = self._PUNCH_FIRST_ROW
+            prev_sr = None
+            for val in self.colvalues(ws, self.punch_cols['sr_no'], self._PUNCH_FIRST_ROW):
                 if val is None:
                     break
+                prev_sr = val
                 row_num += 1
 
-            prev_sr = None
-            if row_num > 8:
-                prev_sr = self.readcell(ws, row_num - 1, self.punch_cols['sr_no'])
-
             try:
                 sr_no_assigned = int(prev_sr) + 1 if prev_sr is not None else 1
             except:
@@ -1540,8 +1755,7 @@ class CircuitInspector:
             self.writecell(ws, row_num, self.punch_cols['checked_date'], 
                           datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
-            wb.save(self.excel_file)
-            wb.close()
+            self.saveworkingxl(wb)
 
             annotation['component'] = custom_category
             annotation['error'] = 'Custom'
@@ -1551,7 +1765,7 @@ class CircuitInspector:
             annotation['sr_no'] = sr_no_assigned
             annotation['timestamp'] = datetime.now().isoformat()
 
-            self.annotations.append(annotation)
+            self._add_ann(annotation)
             self.current_sr_no = self.getnextsr()
             self.display()
 
@@ -1647,8 +1861,7 @@ class CircuitInspector:
 
         try:
             page = self.pdf_document[self.current_page]
-            mat = fitz.Matrix(self.page_to_display_scale(), self.page_to_display_scale())
-            pix = page.get_pixmap(matrix=mat)
+            pix = page.get_pixmap(matrix=self._display_matrix())
             img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
             self.current_page_image = np.array(img)
             draw = ImageDraw.Draw(img, 'RGBA')
@@ -1852,7 +2065,7 @@ class CircuitInspector:
         self.session_refs = set(data.get('session_refs', []))
 
         # Restore annotations with proper type conversion
-        self.annotations = []
+        self._reset_annotations()
         highlight_count = 0
         pen_count = 0
         text_count = 0
@@ -1884,7 +2097,7 @@ class CircuitInspector:
             if 'text' in ann:
                 ann['text'] = str(ann['text'])
 
-            self.annotations.append(ann)
+            self._add_ann(ann)
 
             # Add ref_no to session refs
             if ann.get('ref_no'):
@@ -2222,21 +2435,12 @@ class CircuitInspector:
         self.root.bind_all("<Control-P>", lambda e: self.punchclosing())
         self.root.bind_all("<Control-E>", lambda e: self.openxcl())
         self.root.bind_all("<Control-V>", lambda e: self.viewhandbacks())
-        self.root.bind_all("<Control-plus>", lambda e: self.zoom++())
+        self.root.bind_all("<Control-plus>", lambda e: self.zoomin())
         self.root.bind_all("<Control-minus>", lambda e: self.zoomout())
         self.root.bind_all("<Escape>", lambda e: self.deactivate())
         
         # Modern button style
-        btn_style = {
-            'bg': '#3b82f6',
-            'fg': 'white',
-            'padx': 12,
-            'pady': 10,
-            'font': ('Segoe UI', 9, 'bold'),
-            'relief': tk.FLAT,
-            'borderwidth': 0,
-            'cursor': 'hand2'
-        }
+        btn_style = self._BTN_STYLE
         
         # Left section - File operations
         left_frame = tk.Frame(toolbar, bg='#1e293b')
@@ -2310,8 +2514,7 @@ class CircuitInspector:
                                    fg='white', font=('Segoe UI', 10, 'bold'))
         self.page_label.pack(side=tk.LEFT, padx=10)
         
-        nav_btn_style = btn_style.copy()
-        nav_btn_style['bg'] = '#64748b'
+        nav_btn_style = self._NAV_BTN_STYLE
         
         tk.Button(center_frame, text="<", command=self.prev, width=3,
                  **nav_btn_style).pack(side=tk.LEFT, padx=2)
@@ -2322,8 +2525,7 @@ class CircuitInspector:
         zoom_frame = tk.Frame(center_frame, bg='#1e293b')
         zoom_frame.pack(side=tk.LEFT, padx=15)
         
-        zoom_btn_style = btn_style.copy()
-        zoom_btn_style['bg'] = '#10b981'
+        zoom_btn_style = self._ZOOM_BTN_STYLE
         
         tk.Button(zoom_frame, text="🔍+", command=self.zoomin, width=4,
                  **zoom_btn_style).pack(side=tk.LEFT, padx=2)
@@ -2378,15 +2580,13 @@ class CircuitInspector:
         right_frame = tk.Frame(toolbar, bg='#1e293b')
         right_frame.pack(side=tk.RIGHT, padx=10, pady=10)
         
-        verify_btn_style = btn_style.copy()
-        verify_btn_style['bg'] = '#ec4899'
+        verify_btn_style = self._VERIFY_BTN_STYLE
         
         tk.Button(right_frame, text=" Verify ",
                  command=self.viewhandbacks,
                  **verify_btn_style).pack(side=tk.RIGHT, padx=3)
         
-        handover_btn_style = btn_style.copy()
-        handover_btn_style['bg'] = '#8b5cf6'
+        handover_btn_style = self._HANDOVER_BTN_STYLE
         
         tk.Button(right_frame, text="Handover",
                  command=self.handover,
@@ -2532,25 +2732,27 @@ class CircuitInspector:
 
     def colourmenu(self):
         """Show color picker dropdown menu"""
-        menu = Menu(self.root, tearoff=0, bg='#1e293b', fg='white',
-                   activebackground='#3b82f6', activeforeground='white',
-                   font=('Segoe UI', 10))
-        
-        for color_key, color_info in self.highlighter_colors.items():
-            rgb = color_info['rgb']
-            hex_color = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
-            label = f"->{color_info['name']}"
-            
-            menu.add_command(
-                label=label,
-                command=lambda ck=color_key: self.colorchange(ck),
-                foreground=hex_color,
-                font=('Arial', 12, 'bold')
-            )
+        if self._color_menu is None:
+            menu = Menu(self.root, tearoff=0, bg='#1e293b', fg='white',
+                       activebackground='#3b82f6', activeforeground='white',
+                       font=('Segoe UI', 10))
+            
+            for color_key, color_info in self.highlighter_colors.items():
+                rgb = color_info['rgb']
+                hex_color = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
+                label = f"->{color_info['name']}"
+                
+                menu.add_command(
+                    label=label,
+                    command=lambda ck=color_key: self.colorchange(ck),
+                    foreground=hex_color,
+                    font=('Arial', 12, 'bold')
+                )
+            self._color_menu = menu
         
         x = self.dropdown_btn.winfo_rootx()
         y = self.dropdown_btn.winfo_rooty() + self.dropdown_btn.winfo_height()
-        menu.post(x, y)
+        self._color_menu.post(x, y)
 
 
     def colorchange(self, color_key):
@@ -2641,18 +2843,19 @@ class CircuitInspector:
         Args: message - Text to display, bg - background color (green for success, orange for warning)
         """
         """Show a temporary status message"""
-        status_label = tk.Label(
-            self.root, 
-            text=message, 
-            bg=bg, 
-            fg='white', 
-            font=('Segoe UI', 10, 'bold'),
-            padx=25, 
-            pady=12,
-            relief=tk.FLAT
-        )
-        status_label.place(relx=0.5, rely=0.08, anchor='center')
-        self.root.after(1500, lambda: status_label.destroy())
+        self._status_lbl.configure(text=message, bg=bg)
+        self._status_lbl.place(relx=0.5, rely=0.08, anchor='center')
+        # Label is created before the toolbar/canvas, so raise it above them
+        self._status_lbl.lift()
+
+        if self._status_after_id:
+            self.root.after_cancel(self._status_after_id)
+        self._status_after_id = self.root.after(1500, self._hide_flash_status)
+
+    def _hide_flash_status(self):
+        """Hide the shared flash-status label once its timeout expires."""
+        self._status_after_id = None
+        self._status_lbl.place_forget()
 
     # ================================================================
     # UNDO FUNCTIONALITY
@@ -2674,6 +2877,32 @@ class CircuitInspector:
         if len(self.undo_stack) > self.max_undo:
             self.undo_stack.pop(0)
 
+    def _reset_annotations(self):
+        """Empty self.annotations along with its per-page and punch tallies."""
+        self.annotations = []
+        self._ann_pages = Counter()
+        self._error_count = 0
+
+    def _tally_ann(self, ann, sign):
+        """Count an annotation in (+1) or out (-1) of _ann_pages and _error_count."""
+        page = ann.get('page')
+        if page is not None:
+            self._ann_pages[page] += sign
+            if self._ann_pages[page] <= 0:
+                del self._ann_pages[page]
+        if ann.get('type') == 'error':
+            self._error_count += sign
+
+    def _add_ann(self, ann):
+        """Append an annotation; the tallies let a sync skip rescanning the list."""
+        self.annotations.append(ann)
+        self._tally_ann(ann, 1)
+
+    def _remove_ann(self, ann):
+        """Remove an annotation and take it out of the tallies."""
+        self.annotations.remove(ann)
+        self._tally_ann(ann, -1)
+
     def undolast(self):
         """
         Reverse most recent annotation change from undo stack.
@@ -2690,7 +2919,7 @@ class CircuitInspector:
         if last_action['type'] == 'add_annotation':
             annotation = last_action['annotation']
             if annotation in self.annotations:
-                self.annotations.remove(annotation)
+                self._remove_ann(annotation)
                 self.display()
                 self.flashstat("Annotation removed", bg='#10b981')
         
@@ -2708,7 +2937,7 @@ class CircuitInspector:
         """
         if self.pdf_document and self.current_page > 0:
             self.current_page -= 1
-            self.display()
+            self._schedule_display()
 
     def next(self):
         """
@@ -2718,27 +2947,68 @@ class CircuitInspector:
         """
         if self.pdf_document and self.current_page < len(self.pdf_document) - 1:
             self.current_page += 1
-            self.display()
+            self._schedule_display()
 
     def zoomin(self):
         """
         Increase zoom level for detail inspection.
-        FUNCTIONAL USE: Multiplies zoom_level by 1.2 for magnified PDF view.
+        FUNCTIONAL USE: Steps zoom_level up to the next entry in _ZOOM_LEVELS.
         Bound to zoom button and Ctrl++ shortcut for detailed quality inspection.
         """
-        if self.zoom_level < 3.0:
-            self.zoom_level += 0.25
-            self.display()
+        idx = self._zoom_index()
+        if idx < len(self._ZOOM_LEVELS) - 1:
+            self.zoom_level = self._ZOOM_LEVELS[idx + 1]
+            self._schedule_display()
 
     def zoomout(self):
         """
         Decrease zoom level for broader view.
-        FUNCTIONAL USE: Divides zoom_level by 1.2 for zoomed-out PDF view.
+        FUNCTIONAL USE: Steps zoom_level down to the previous entry in _ZOOM_LEVELS.
         Bound to zoom button and Ctrl+- shortcut for comprehensive page view.
         """
-        if self.zoom_level > 0.5:
-            self.zoom_level -= 0.25
-            self.display()
+        idx = self._zoom_index()
+        if idx > 0:
+            self.zoom_level = self._ZOOM_LEVELS[idx - 1]
+            self._schedule_display()
+
+    def _zoom_index(self):
+        """Return the index of the zoom step closest to the current zoom_level."""
+        levels = self._ZOOM_LEVELS
+        return min(range(len(levels)), key=lambda i: abs(levels[i] - self.zoom_level))
+
+    def _display_matrix(self):
+        """Return the cached render matrix for the current zoom level."""
+        mat = self._zoom_matrices.get(self.zoom_level)
+        if mat is None:
+            scale = self.page_to_display_scale()
+            mat = fitz.Matrix(scale, scale)
+            self._zoom_matrices[self.zoom_level] = mat
+        return mat
+
+    def _schedule_display(self):
+        """Coalesce bursts of page/zoom changes into one redraw per idle tick."""
+        if self._display_pending:
+            return
+        self._display_pending = True
+        self.root.after_idle(self._do_display)
+
+    def _do_display(self):
+        """Run the redraw queued by _schedule_display."""
+        self._display_pending = False
+        self.display()
+
+    def _schedule_stats_sync(self, delay=500):
+        """Coalesce a burst of edits into one manager-stats sync, delay ms after the last one."""
+        if self._stats_sync_after_id:
+            self.root.after_cancel(self._stats_sync_after_id)
+        self._stats_sync_after_id = self.root.after(delay, self._do_stats_sync)
+
+    def _do_stats_sync(self):
+        """Run the sync queued by _schedule_stats_sync (also used to flush it early)."""
+        if self._stats_sync_after_id:
+            self.root.after_cancel(self._stats_sync_after_id)
+        self._stats_sync_after_id = None
+        self.sync_manager_stats_only()
 
     # ================================================================
     # PLACEHOLDER METHODS - Implement from your original code
@@ -2759,6 +3029,7 @@ class CircuitInspector:
             try:
                 # Temporarily hold source path before project details are collected.
                 self.current_pdf_path = file_path
+                self.prefetch_ocr()
                 self.askprojdetails()
 
                 if not self.preparefolders():
@@ -2772,7 +3043,7 @@ class CircuitInspector:
                 self.pdf_document = fitz.open(central_pdf_path)
                 self.current_pdf_path = central_pdf_path
                 self.current_page = 0
-                self.annotations = []
+                self._reset_annotations()
                 self.zoom_level = 1.0
                 self.tool_mode = None
                 self.active_highlighter = None
@@ -2840,6 +3111,134 @@ class CircuitInspector:
             print(f"Error loading categories: {e}")
             self.categories = []
 
+    def _excel_stat_key(self, path):
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def __getstate__(self):
+        """Leave parsed workbooks and the open PDF out of copies/pickles."""
+        state = self.__dict__.copy()
+        for key in ('_wb_cache', '_wb_base_stat', 'pdf_document', '_xl_lock', '_sync_queue',
+                    '_sync_thread', '_punch_dlg'):
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._wb_cache = OrderedDict()
+        self._wb_base_stat = weakref.WeakKeyDictionary()
+        self._xl_lock = threading.RLock()
+        self._sync_queue = queue.Queue()
+        self._sync_thread = None
+        self._punch_dlg = None
+        self.pdf_document = None
+
+    def _get_wb(self, path, data_only=False):
+        """
+        Return a parsed workbook for reading, reusing the cached one while the file
+        is unchanged on disk. Callers must not modify it; use openworkingxl() to edit.
+        """
+        key = (os.path.abspath(path), data_only)
+        stat = self._excel_stat_key(path)
+        with self._xl_lock:
+            hit = self._wb_cache.get(key)
+            if hit and hit[0] == stat:
+                self._wb_cache.move_to_end(key)
+                return hit[1]
+
+        # Parse outside the lock so a slow load never stalls other cache users
+        wb = load_workbook(path, data_only=data_only)
+        with self._xl_lock:
+            # Another caller may have published the same file meanwhile; keep theirs
+            hit = self._wb_cache.get(key)
+            if hit and hit[0] == stat:
+                self._wb_cache.move_to_end(key)
+                return hit[1]
+            self._wb_cache[key] = (stat, wb)
+            self._wb_cache.move_to_end(key)
+            while len(self._wb_cache) > self._WB_CACHE_SIZE:
+                self._wb_cache.popitem(last=False)
+            return wb
+
+    def _drop_wb(self, path):
+        """Forget every cached copy of path after it has been written."""
+        path = os.path.abspath(path)
+        with self._xl_lock:
+            for key in [k for k in self._wb_cache if k[0] == path]:
+                del self._wb_cache[key]
+            self._punches_cache.pop(path, None)
+            self._punch_desc_cache.pop(path, None)
+            self._open_count_cache.pop(path, None)
+            self._interphase_status_cache.pop(path, None)
+
+    def cachedworkingxl(self, path=None):
+        """Return the cached editable workbook for path (default: working Excel) if still current."""
+        path = path or self.excel_file
+        if not path:
+            return None
+        key = (os.path.abspath(path), False)
+        with self._xl_lock:
+            hit = self._wb_cache.get(key)
+            if not hit:
+                return None
+            try:
+                if hit[0] == self._excel_stat_key(path):
+                    return hit[1]
+            except OSError:
+                pass
+            del self._wb_cache[key]
+            return None
+
+    def openworkingxl(self, path=None):
+        """
+        Open the working Excel for editing, reusing the workbook kept from the last save.
+        The cache entry is handed over to the caller and only restored by saveworkingxl(),
+        so a failed edit never leaves half-written state behind for the next caller.
+        The file stat the workbook matches is recorded for releaseworkingxl().
+        """
+        path = path or self.excel_file
+        with self._xl_lock:
+            wb = self.cachedworkingxl(path)
+            if wb is not None:
+                stat = self._wb_cache[(os.path.abspath(path), False)][0]
+            self._drop_wb(path)
+        if wb is None:
+            # Stat before parsing: a write during the load then shows up as a mismatch
+            stat = self._excel_stat_key(path)
+            wb = load_workbook(path)
+        self._wb_base_stat[wb] = stat
+        return wb
+
+    def saveworkingxl(self, wb, path=None, release=True):
+        """
+        Save the working Excel and keep the workbook open for the next edit. With
+        release=False the caller keeps editing it (a checkpoint save from an open dialog)
+        and hands it back with releaseworkingxl() when done; until then it stays uncached.
+        """
+        path = path or self.excel_file
+        wb.save(path)
+        self._drop_wb(path)
+        self._wb_base_stat[wb] = self._excel_stat_key(path)
+        if release:
+            self.releaseworkingxl(wb, path)
+
+    def releaseworkingxl(self, wb, path=None):
+        """
+        Hand a workbook from openworkingxl() back to the cache. If the file changed on disk
+        since the workbook was opened or saved, it is dropped instead, so the next edit
+        reloads the file rather than saving the stale copy over it.
+        """
+        path = path or self.excel_file
+        with self._xl_lock:
+            try:
+                stat = self._excel_stat_key(path)
+            except OSError:
+                stat = None
+            if stat is None or self._wb_base_stat.get(wb) != stat:
+                self._drop_wb(path)
+                return
+            self._wb_cache[(os.path.abspath(path), False)] = (stat, wb)
+
     def getnextsr(self):
         """
         Calculate next available punch serial number from Excel Punch Sheet.
@@ -2850,19 +3249,16 @@ class CircuitInspector:
         try:
             if not self.excel_file or not os.path.exists(self.excel_file):
                 return 1
-            wb = load_workbook(self.excel_file, read_only=True)
+            wb = self.cachedworkingxl() or load_workbook(self.excel_file, read_only=True)
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
             last_sr_no = 0
-            row_num = 8
-            while row_num <= ws.max_row + 5:
-                val = self.readcell(ws, row_num, self.punch_cols['sr_no'])
+            for val in self.colvalues(ws, self.punch_cols['sr_no'], self._PUNCH_FIRST_ROW):
                 if val is None:
                     break
                 try:
                     last_sr_no = int(val)
                 except:
                     pass
-                row_num += 1
             wb.close()
             return last_sr_no + 1
         except Exception:
@@ -2898,11 +3294,7 @@ class CircuitInspector:
 
     # Excel cell helpers
     def splitcell(self, cell_ref):
-        m = re.match(r"([A-Z]+)(\d+)", cell_ref)
-        if not m:
-            raise ValueError(f"Invalid cell reference: {cell_ref}")
-        col, row = m.groups()
-        return int(row), col
+        return split_cell_ref(cell_ref)
 
     def resolvemergedtar(self, ws, row, col_idx):
         for merged in ws.merged_cells.ranges:
@@ -2926,6 +3318,19 @@ class CircuitInspector:
         target_row, target_col = self.resolvemergedtar(ws, int(row), col_idx)
         return ws.cell(row=target_row, column=target_col).value
 
+    def colvalues(self, ws, col, start_row):
+        """Yield one column's values from start_row down in a single sweep (no merge lookup)."""
+        if isinstance(col, str):
+            col = column_index_from_string(col)
+        for (value,) in ws.iter_rows(min_row=start_row, min_col=col, max_col=col, values_only=True):
+            yield value
+
+
+    def prefetch_ocr(self):
+        """Warm the OCR engine in the background while the details dialog is open."""
+        if self._ocr_warmup is None:
+            self._ocr_warmup = threading.Thread(target=_warm_ocr_engine, daemon=True)
+            self._ocr_warmup.start()
 
     def askprojdetails(self):
         """Ask for project details while enforcing central storage policy."""
@@ -2994,12 +3399,22 @@ class CircuitInspector:
             font=('Segoe UI', 9)
         ).pack(anchor="w", padx=20)
 
+        # Cache DB lookups per project name for the lifetime of the dialog
+        loc_cache = {}
+        lookup_after = [None]
+
+        def lookup_location(project_name):
+            if project_name not in loc_cache:
+                loc_cache[project_name] = self.db.get_project_location(project_name)
+            return loc_cache[project_name]
+
         # Auto-load location when project name changes
-        def on_project_name_change(*args):
+        def apply_project_location():
+            lookup_after[0] = None
             project_name = project_var.get().strip()
             if project_name:
                 # Check database for existing project location
-                existing_location = self.db.get_project_location(project_name)
+                existing_location = lookup_location(project_name)
                 if existing_location:
                     location_var.set(existing_location)
                     # Show visual feedback
@@ -3007,10 +3422,25 @@ class CircuitInspector:
                     dlg.after(1000, lambda: location_entry.config(bg='white'))
                 else:
                     location_var.set(get_base_path())
+
+        def on_project_name_change(*args):
+            # Debounce so typing a name costs one lookup instead of one per keystroke
+            if lookup_after[0]:
+                dlg.after_cancel(lookup_after[0])
+            lookup_after[0] = dlg.after(200, apply_project_location)
         
         # Tcl 9 compatibility: trace() is deprecated; use trace_add().
         project_var.trace_add('write', on_project_name_change)
 
+        def on_destroy(event):
+            # However the dialog goes away (OK, window close), a pending lookup must not
+            # fire against its destroyed widgets
+            if event.widget is dlg and lookup_after[0]:
+                dlg.after_cancel(lookup_after[0])
+                lookup_after[0] = None
+
+        dlg.bind('<Destroy>', on_destroy)
+
         def on_ok():
             cabinet = cabinet_var.get().strip()
             project = project_var.get().strip()
@@ -3021,6 +3451,10 @@ class CircuitInspector:
                 messagebox.showerror("Missing Information", 
                                    "Please fill in Cabinet ID and Project Name.")
                 return
+
+            if lookup_after[0]:
+                dlg.after_cancel(lookup_after[0])
+                lookup_after[0] = None
             
             # Check if this cabinet already exists in database
             if self.db.project_exists(cabinet):
@@ -3039,7 +3473,7 @@ class CircuitInspector:
                     return
             else:
                 # New cabinet - check if project exists with different cabinet
-                existing_project_location = self.db.get_project_location(project)
+                existing_project_location = lookup_location(project)
                 
                 if existing_project_location:
                     # Project exists, use its location
@@ -3080,28 +3514,30 @@ class CircuitInspector:
             return
 
         try:
-            wb = load_workbook(self.excel_file)
+            wb = self.openworkingxl()
+            changed = False
 
-            for sheet_name, cells in self.header_cells.items():
+            for sheet_name, cells in self._header_cells_rc.items():
                 if sheet_name not in wb.sheetnames:
                     continue
 
                 ws = wb[sheet_name]
 
-                if getattr(self, "project_name", ""):
-                    r, c = self.splitcell(cells["project_name"])
-                    self.writecell(ws, r, c, self.project_name)
-
-                if getattr(self, "sales_order_no", ""):
-                    r, c = self.splitcell(cells["sales_order"])
-                    self.writecell(ws, r, c, self.sales_order_no)
-
-                if getattr(self, "cabinet_id", ""):
-                    r, c = self.splitcell(cells["cabinet_id"])
-                    self.writecell(ws, r, c, self.cabinet_id)
-
-            wb.save(self.excel_file)
-            wb.close()
+                for key, value in (("project_name", getattr(self, "project_name", "")),
+                                   ("sales_order", getattr(self, "sales_order_no", "")),
+                                   ("cabinet_id", getattr(self, "cabinet_id", ""))):
+                    if not value:
+                        continue
+                    r, c = cells[key]
+                    if self.readcell(ws, r, c) != value:
+                        self.writecell(ws, r, c, value)
+                        changed = True
+
+            # Header already up to date: skip rewriting the whole file
+            if changed:
+                self.saveworkingxl(wb)
+            else:
+                self.releaseworkingxl(wb)
 
         except PermissionError:
             messagebox.showerror("Excel Locked", "Please close the Excel file before entering project details.")
@@ -3146,8 +3582,16 @@ class CircuitInspector:
             "sessions": os.path.join(cabinet_root, "Sessions")
         }
         
-        for p in folders.values():
-            os.makedirs(p, exist_ok=True)
+        # Ancestors are resolved once; the leaves are direct children of cabinet_root
+        os.makedirs(cabinet_root, exist_ok=True)
+        for key, p in folders.items():
+            if key == "root":
+                continue
+            try:
+                os.mkdir(p)
+            except FileExistsError:
+                if not os.path.isdir(p):
+                    raise
         
         self.project_dirs = folders
         return True
@@ -3209,41 +3653,51 @@ class CircuitInspector:
         if not self.excel_file or not os.path.exists(self.excel_file):
             return punches
 
+        # Reuse the last scan while the file is unchanged; hand out copies so callers can edit them
+        cache_key = os.path.abspath(self.excel_file)
+        stat = self._excel_stat_key(self.excel_file)
+        cached = self._punches_cache.get(cache_key)
+        if cached and cached[0] == stat:
+            return [dict(p) for p in cached[1]]
+
         try:
-            wb = load_workbook(self.excel_file, data_only=True)
+            wb = load_workbook(self.excel_file, read_only=True, data_only=True)
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
 
-            row = 8
-            while True:
-                sr = self.readcell(ws, row, self.punch_cols['sr_no'])
+            # Data rows start below the merged rows 7-8 header and have no merged
+            # cells of their own, so plain tuple offsets are safe
+            col = self._punch_col_idx
+            first = self._PUNCH_FIRST_ROW
+
+            for row, vals in enumerate(
+                ws.iter_rows(min_row=first, max_col=max(col.values()) + 1, values_only=True),
+                start=first
+            ):
+                sr = vals[col['sr_no']]
                 if sr is None:
                     break
 
                 # Check if punch is closed
-                closed = self.readcell(ws, row, self.punch_cols['closed_name'])
-                if closed:
-                    row += 1
+                if vals[col['closed_name']]:
                     continue
 
-                # Check if punch is implemented
-                implemented = bool(self.readcell(ws, row, self.punch_cols['implemented_name']))
+                implemented_name = vals[col['implemented_name']]
 
                 punches.append({
                     'sr_no': sr,
                     'row': row,
-                    'ref_no': self.readcell(ws, row, self.punch_cols['ref_no']),
-                    'punch_text': self.readcell(ws, row, self.punch_cols['desc']),
-                    'category': self.readcell(ws, row, self.punch_cols['category']),
-                    'implemented': implemented,
-                    'implemented_name': self.readcell(ws, row, self.punch_cols['implemented_name']),
-                    'implemented_date': self.readcell(ws, row, self.punch_cols['implemented_date']),
-                    'checked_name': self.readcell(ws, row, self.punch_cols['checked_name']),
-                    'checked_date': self.readcell(ws, row, self.punch_cols['checked_date'])
+                    'ref_no': vals[col['ref_no']],
+                    'punch_text': vals[col['desc']],
+                    'category': vals[col['category']],
+                    'implemented': bool(implemented_name),
+                    'implemented_name': implemented_name,
+                    'implemented_date': vals[col['implemented_date']],
+                    'checked_name': vals[col['checked_name']],
+                    'checked_date': vals[col['checked_date']]
                 })
 
-                row += 1
-
             wb.close()
+            self._punches_cache[cache_key] = (stat, [dict(p) for p in punches])
             return punches
             
         except Exception as e:
@@ -3259,18 +3713,21 @@ class CircuitInspector:
 
     def reviewbeforesave(self, checklist_path, refs_set):
         """Modern dialog for reviewing and marking checklist items with name and date"""
+        # One workbook serves both the scan and the edits
+        wb = self.openworkingxl(checklist_path)
         try:
-            cols, matches = self.checklistmatches(checklist_path, refs_set)
+            cols, matches = self.checklistmatches(checklist_path, refs_set, wb=wb)
         except Exception as e:
+            self.releaseworkingxl(wb, checklist_path)
             raise
 
         if not matches:
+            self.releaseworkingxl(wb, checklist_path)
             messagebox.showinfo("Checklist Complete", 
                               " No items requiring review.\nAll Interphase items are up to date.",
                               icon='info')
             return
 
-        wb = load_workbook(checklist_path)
         ws = wb[self.interphase_sheet_name]
         
         # Extract all columns
@@ -3347,6 +3804,47 @@ class CircuitInspector:
 
         show_item(pos[0])
 
+        # Edits are kept in the open workbook and saved every _REVIEW_SAVE_EVERY items
+        # and when the dialog closes
+        pending = [0]
+        discarded = [False]
+
+        def flush():
+            if not pending[0]:
+                return True
+            try:
+                # Stays out of the cache until the dialog closes, so edits made
+                # after this checkpoint can't reach another writer if discarded
+                self.saveworkingxl(wb, checklist_path, release=False)
+            except PermissionError:
+                messagebox.showerror("File Locked", 
+                                   "⚠️ Please close the Excel file and try again.",
+                                   icon='error',
+                                   parent=dlg)
+                return False
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to update checklist:\n{e}",
+                                   parent=dlg)
+                return False
+            pending[0] = 0
+            self.sync_manager_stats_only()
+            return True
+
+        def mark_dirty():
+            pending[0] += 1
+            if pending[0] >= self._REVIEW_SAVE_EVERY:
+                flush()
+
+        def close_dialog():
+            if flush() or messagebox.askyesno(
+                "Discard Changes",
+                "Checklist changes could not be saved.\nClose and discard them?",
+                parent=dlg
+            ):
+                discarded[0] = bool(pending[0])
+                pending[0] = 0
+                dlg.destroy()
+
         def do_action_set_status(status_value):
             r, ref_str, desc = matches[pos[0]]
             current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -3359,16 +3857,12 @@ class CircuitInspector:
                 self.writecell(ws, r, status_col, status_value)
                 self.writecell(ws, r, name_col, username)
                 self.writecell(ws, r, date_col, current_date)
-                wb.save(checklist_path)
-            except PermissionError:
-                messagebox.showerror("File Locked", 
-                                   "⚠️ Please close the Excel file and try again.",
-                                   icon='error')
-                return
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update checklist:\n{e}")
                 return
 
+            mark_dirty()
+
             if pos[0] < len(matches) - 1:
                 pos[0] += 1
                 show_item(pos[0])
@@ -3376,15 +3870,13 @@ class CircuitInspector:
                 messagebox.showinfo("Review Complete", 
                                   f"Checklist review finished!\n{len(matches)} items processed.",
                                   icon='info')
-                dlg.destroy()
+                close_dialog()
 
         def on_ok():
             do_action_set_status("OK")
-            self.sync_manager_stats_only()
 
         def on_nok():
             do_action_set_status("NOK")
-            self.sync_manager_stats_only()
 
         def on_na():
             """Handle N/A status with mandatory remark"""
@@ -3416,18 +3908,11 @@ class CircuitInspector:
                 self.writecell(ws, r, date_col, current_date)
                 self.writecell(ws, r, name_col, username)
                 self.writecell(ws, r, remark_col, remark)
-                wb.save(checklist_path)
+                mark_dirty()
                 
                 messagebox.showinfo("Remark Saved", 
                                   f"N/A status with remark:\n{remark}",
                                   parent=dlg)
-                self.sync_manager_stats_only()
-            except PermissionError:
-                messagebox.showerror("File Locked", 
-                                   "⚠️ Please close the Excel file and try again.",
-                                   icon='error',
-                                   parent=dlg)
-                return
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to update checklist:\n{e}",
                                    parent=dlg)
@@ -3437,7 +3922,7 @@ class CircuitInspector:
                 pos[0] += 1
                 show_item(pos[0])
             else:
-                dlg.destroy()
+                close_dialog()
 
         def on_prev():
             if pos[0] > 0:
@@ -3477,54 +3962,94 @@ class CircuitInspector:
         tk.Button(btn_frame, text="Next ->", command=on_next, bg='#94a3b8', 
                  fg='white', width=12, **btn_style).pack(side=tk.LEFT, padx=5)
         
-        tk.Button(btn_frame, text="Cancel", command=lambda: dlg.destroy(), 
-                 bg='#64748b', fg='white', width=10, **btn_style).pack(side=tk.RIGHT, padx=5)
+        tk.Button(btn_frame, text="Save & Close", command=close_dialog, 
+                 bg='#64748b', fg='white', width=12, **btn_style).pack(side=tk.RIGHT, padx=5)
 
-        dlg.wait_window()
+        dlg.protocol("WM_DELETE_WINDOW", close_dialog)
+        try:
+            dlg.wait_window()
+        finally:
+            # Last-chance flush if the dialog went away without close_dialog();
+            # a clean workbook goes back to the cache for the next edit, a discarded
+            # one never does
+            try:
+                if pending[0]:
+                    self.saveworkingxl(wb, checklist_path)
+                elif not discarded[0]:
+                    self.releaseworkingxl(wb, checklist_path)
+                else:
+                    self._drop_wb(checklist_path)
+            except Exception as e:
+                print(f"Checklist save on close failed: {e}")
 
 
     # ================================================================
     # 4. HELPER: gather_checklist_matches - Returns column info and matches
     # ================================================================
 
-    def checklistmatches(self, checklist_path, refs_set):
-        """Returns Interphase rows where Reference No is NOT in refs_set."""
-        wb = load_workbook(checklist_path)
+    def checklistmatches(self, checklist_path, refs_set, wb=None):
+        """
+        Returns Interphase rows where Reference No is NOT in refs_set.
+        Pass an already open wb to scan it instead of streaming the file again.
+        """
+        own_wb = wb is None
+        if own_wb:
+            wb = load_workbook(checklist_path, read_only=True)
         if self.interphase_sheet_name not in wb.sheetnames:
-            wb.close()
+            if own_wb:
+                wb.close()
             raise ValueError("Interphase sheet not found")
 
         ws = wb[self.interphase_sheet_name]
-        ref_col = self.interphase_cols['ref_no']
-        desc_col = self.interphase_cols['description']
-        status_col = self.interphase_cols['status']
-        name_col = self.interphase_cols['name']
-        date_col = self.interphase_cols['date']
-        remark_col = self.interphase_cols['remark']
+        ic = self.interphase_cols
+        ref_col = ic['ref_no']
+        desc_col = ic['description']
+        status_col = ic['status']
+        name_col = ic['name']
+        date_col = ic['date']
+        remark_col = ic['remark']
+
+        # Stream only the ref..status span and index the tuples directly
+        ref_idx = column_index_from_string(ref_col)
+        desc_idx = column_index_from_string(desc_col)
+        status_idx = column_index_from_string(status_col)
+        min_col = min(ref_idx, desc_idx, status_idx)
+        max_col = max(ref_idx, desc_idx, status_idx)
+        ref_idx -= min_col
+        desc_idx -= min_col
+        status_idx -= min_col
+        done = self._DONE_STATUSES
+        # Normalise once so membership is O(1) whatever the caller passed
+        refs = frozenset(str(x).strip() for x in refs_set)
 
         matches = []
-        max_row = ws.max_row if ws.max_row else 2000
+        add_match = matches.append
 
-        for r in range(11, max_row + 1):
-            ref_val = self.readcell(ws, r, ref_col)
+        for r, row in enumerate(
+            ws.iter_rows(min_row=11, min_col=min_col, max_col=max_col, values_only=True),
+            start=11
+        ):
+            ref_val = row[ref_idx]
             if ref_val is None:
                 continue
 
-            ref_str = str(ref_val).strip()
+            ref_str = (ref_val if type(ref_val) is str else str(ref_val)).strip()
 
-            if ref_str in refs_set:
+            if ref_str in refs:
                 continue
 
-            status_val = self.readcell(ws, r, status_col)
-            status_str = str(status_val).strip().lower() if status_val is not None else ''
-
-            if status_str in ('ok', 'nok', 'n/a', 'na', 'not applicable'):
+            # Unreviewed rows are usually blank: skip the string work for them
+            status_val = row[status_idx]
+            if status_val is not None and (
+                status_val if type(status_val) is str else str(status_val)
+            ).strip().lower() in done:
                 continue
 
-            desc_val = self.readcell(ws, r, desc_col) or ''
-            matches.append((r, ref_str, str(desc_val)))
+            desc_val = row[desc_idx] or ''
+            add_match((r, ref_str, str(desc_val)))
 
-        wb.close()
+        if own_wb:
+            wb.close()
         return {
             'ref_col': ref_col, 
             'desc_col': desc_col, 
@@ -3552,7 +4077,8 @@ class CircuitInspector:
         )
 
         try:
-            shutil.copy2(self.excel_file, save_path)
+            # Export copy only needs the bytes, not the source timestamps
+            shutil.copyfile(self.excel_file, save_path)
         except PermissionError:
             messagebox.showerror("File Open", "Close the Excel file and try again.")
         except Exception as e:
@@ -3579,63 +4105,95 @@ class CircuitInspector:
     # FUZZY MATCH HELPER
     # ================================================================
 
-    def findrow(self, sr_no, punch_text, min_ratio=0.60):
+    def punchindex(self):
+        """
+        SR numbers and normalised descriptions of the punch sheet, cached on the file's stat.
+        Returns (sr_rows, desc_rows, desc_norm): sr_rows is [(row, sr)] up to the first blank
+        row; desc_rows/desc_norm are parallel lists of row numbers and stripped, lowercased text.
+        """
+        cache_key = os.path.abspath(self.excel_file)
+        stat = self._excel_stat_key(self.excel_file)
+        cached = self._punch_desc_cache.get(cache_key)
+        if cached and cached[0] == stat:
+            return cached[1]
+
+        wb = load_workbook(self.excel_file, read_only=True)
         try:
-            wb = load_workbook(self.excel_file, read_only=True)
             ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
-            row = 8
 
-            while True:
-                cell = self.readcell(ws, row, self.punch_cols['sr_no'])
+            sr_col = self._punch_col_idx['sr_no'] + 1
+            desc_col = self._punch_col_idx['desc'] + 1
+            min_col = min(sr_col, desc_col)
+            sr_idx = sr_col - min_col
+            desc_idx = desc_col - min_col
+
+            scan_sr = True
+            sr_rows = []
+            desc_rows = []
+            desc_norm = []
+            # No fixed row cap: read-only iter_rows ends with the sheet's stored rows,
+            # so large punch sheets are indexed in full. Start below the merged header,
+            # whose empty A8/C8 halves would otherwise stop the SR scan at once
+            first = self._PUNCH_FIRST_ROW
+            for row, vals in enumerate(
+                ws.iter_rows(min_row=first, min_col=min_col,
+                             max_col=max(sr_col, desc_col), values_only=True),
+                start=first
+            ):
+                cell = vals[sr_idx]
+                txt = vals[desc_idx]
+                if txt is not None:
+                    desc_rows.append(row)
+                    desc_norm.append(str(txt).strip().lower())
+                if not scan_sr:
+                    continue
                 if cell is None:
-                    if self.readcell(ws, row, self.punch_cols['desc']) is None:
-                        break
-                    else:
-                        row += 1
-                        continue
+                    if txt is None:
+                        scan_sr = False
+                    continue
+                sr_rows.append((row, cell))
+        finally:
+            wb.close()
+
+        index = (sr_rows, desc_rows, desc_norm)
+        self._punch_desc_cache[cache_key] = (stat, index)
+        return index
+
+    def findrow(self, sr_no, punch_text, min_ratio=0.60):
+        try:
+            sr_rows, desc_rows, desc_norm = self.punchindex()
+
+            # Exact SR match wins outright
+            for row, cell in sr_rows:
                 try:
                     if int(cell) == int(sr_no):
-                        wb.close()
                         return (row, 1.0, 'sr_exact')
                 except:
                     if str(cell).strip() == str(sr_no).strip():
-                        wb.close()
                         return (row, 1.0, 'sr_exact')
-                row += 1
-                if row > 2000:
-                    break
 
             best_row = None
             best_ratio = 0.0
-            row = 8
-
-            while True:
-                txt = self.readcell(ws, row, self.punch_cols['desc'])
-                if txt is None:
-                    if row > 2000:
-                        break
-                    row += 1
-                    continue
-                try:
-                    ratio = SequenceMatcher(None, str(punch_text).strip().lower(), str(txt).strip().lower()).ratio()
-                except:
-                    ratio = 0.0
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_row = row
-                row += 1
-                if row > 2000:
-                    break
+            target = str(punch_text).strip().lower()
+
+            if _rf_process is not None and desc_norm:
+                _, score, idx = _rf_process.extractOne(
+                    target, desc_norm, scorer=_rf_fuzz.ratio, processor=None
+                )
+                if score > 0:
+                    best_ratio = score / 100.0
+                    best_row = desc_rows[idx]
+            else:
+                for row, txt in zip(desc_rows, desc_norm):
+                    ratio = SequenceMatcher(None, target, txt).ratio()
+                    if ratio > best_ratio:
+                        best_ratio = ratio
+                        best_row = row
 
-            wb.close()
             if best_row and best_ratio >= min_ratio:
                 return (best_row, best_ratio, 'fuzzy_text')
             return (None, best_ratio, None)
         except Exception as e:
-            try:
-                wb.close()
-            except:
-                pass
             return (None, 0.0, None)
 
     # ============================================================================
@@ -3708,6 +4266,31 @@ class CircuitInspector:
             )
             listbox.insert(tk.END, display_text)
         
+        # Read the selected item's PDF in the background while the user decides
+        prefetched = {}  # pdf_path -> bytes (None while the read is in flight)
+
+        def prefetch(path):
+            if not path or path in prefetched:
+                return
+            prefetched.clear()
+            prefetched[path] = None
+
+            def worker():
+                try:
+                    with open(path, 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    return
+                if path in prefetched:
+                    prefetched[path] = data
+
+            threading.Thread(target=worker, daemon=True).start()
+
+        def on_select(event=None):
+            selection = listbox.curselection()
+            if selection:
+                prefetch(pending_items[selection[0]].get('pdf_path'))
+
         def loadsel():
             selection = listbox.curselection()
             if not selection:
@@ -3734,7 +4317,15 @@ class CircuitInspector:
                     messagebox.showerror("Error", f"PDF file not found:\n{item['pdf_path']}")
                     return
                 
-                self.pdf_document = fitz.open(item['pdf_path'])
+                data = prefetched.pop(item['pdf_path'], None)
+                # Open before closing the current document, so a failed open leaves it usable
+                if data:
+                    doc = fitz.open(stream=data, filetype='pdf')
+                else:
+                    doc = fitz.open(item['pdf_path'])
+                if self.pdf_document:
+                    self.pdf_document.close()
+                self.pdf_document = doc
                 self.current_pdf_path = item['pdf_path']
                 self.current_page = 0
                 self.zoom_level = 1.0
@@ -3749,7 +4340,7 @@ class CircuitInspector:
                 if item.get('session_path') and os.path.exists(item['session_path']):
                     self.loadfrompath(item['session_path'])
                 else:
-                    self.annotations = []
+                    self._reset_annotations()
                     self.display()
                 
                 # UPDATED: Set status to "Rework being verified"
@@ -3785,7 +4376,11 @@ class CircuitInspector:
         tk.Button(btn_frame, text="Cancel", command=dlg.destroy,
                  bg='#64748b', fg='white', **btn_style).pack(side=tk.RIGHT, padx=5)
         
+        listbox.bind('<<ListboxSelect>>', on_select)
         listbox.bind('<Double-Button-1>', lambda e: loadsel())
+        
+        if len(pending_items) == 1:
+            prefetch(pending_items[0].get('pdf_path'))
 
 
     # ============================================================================
@@ -3804,9 +4399,13 @@ class CircuitInspector:
     # NEW: punch_closing_mode_for_verification - Modified punch closing for handback
     # ============================================================================
 
-    def checklistcomp(self):
+    def checklistcomp(self, early_exit=False):
         """Check if all Interphase checklist items have been reviewed
         
+        Args:
+            early_exit: If True, stop at the first pending row; pending_count is then 1
+                        and only the boolean is meaningful
+        
         Returns:
             tuple: (is_complete: bool, pending_count: int)
         """
@@ -3814,31 +4413,39 @@ class CircuitInspector:
             return (True, 0)  # Assume complete if no Excel
         
         try:
-            wb = load_workbook(self.excel_file, data_only=True)
+            wb = self._get_wb(self.excel_file, data_only=True)
             if self.interphase_sheet_name not in wb.sheetnames:
-                wb.close()
                 return (True, 0)
             
             ws = wb[self.interphase_sheet_name]
-            ref_col = self.interphase_cols['ref_no']
-            status_col = self.interphase_cols['status']
+            ref_col = column_index_from_string(self.interphase_cols['ref_no'])
+            status_col = column_index_from_string(self.interphase_cols['status'])
+            c0 = min(ref_col, status_col)
+            ref_off = ref_col - c0
+            status_off = status_col - c0
+            done = self._DONE_STATUSES
             
             pending_count = 0
-            max_row = ws.max_row if ws.max_row else 2000
             
-            for r in range(11, max_row + 1):
-                ref_val = self.readcell(ws, r, ref_col)
-                if ref_val is None:
+            for vals in ws.iter_rows(min_row=11, min_col=c0, max_col=max(ref_col, status_col),
+                                     values_only=True):
+                if vals[ref_off] is None:
                     continue
                 
-                status_val = self.readcell(ws, r, status_col)
-                status_str = str(status_val).strip().lower() if status_val is not None else ''
-                
                 # Check if status is filled (OK, NOK, or N/A)
-                if status_str not in ('ok', 'nok', 'n/a', 'na', 'not applicable'):
+                status_val = vals[status_off]
+                if status_val is None:
+                    pending_count += 1
+                    if early_exit:
+                        break
+                    continue
+                if type(status_val) is not str:
+                    status_val = str(status_val)
+                if status_val.strip().lower() not in done:
                     pending_count += 1
+                    if early_exit:
+                        break
             
-            wb.close()
             return (pending_count == 0, pending_count)
             
         except Exception as e:
@@ -3856,113 +4463,80 @@ class CircuitInspector:
 
         punches.sort(key=lambda p: (not p['implemented'], p['sr_no']))
 
-        # Modern dialog window
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Punch Closing Mode")
-        dlg.geometry("950x650")
-        dlg.configure(bg='#f8fafc')
-        dlg.transient(self.root)
-        dlg.grab_set()
-        
-        # Header
-        header_frame = tk.Frame(dlg, bg='#1e293b', height=50)
-        header_frame.pack(fill=tk.X)
-        header_frame.pack_propagate(False)
-        
-        tk.Label(header_frame, text="Punch Closing Mode", 
-                bg='#1e293b', fg='white', 
-                font=('Segoe UI', 13, 'bold')).pack(pady=12)
-        
-        # Progress
-        progress_frame = tk.Frame(dlg, bg='#f8fafc')
-        progress_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
-        
-        idx_label = tk.Label(progress_frame, text="", font=('Segoe UI', 10, 'bold'),
-                            bg='#f8fafc', fg='#1e293b')
-        idx_label.pack()
-        
-        # Info cards
-        info_frame = tk.Frame(dlg, bg='#f8fafc')
-        info_frame.pack(fill=tk.X, padx=20, pady=8)
-        
-        # SR Number card
-        sr_card = tk.Frame(info_frame, bg='#dbeafe', relief=tk.FLAT)
-        sr_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        
-        tk.Label(sr_card, text="SR No.", font=('Segoe UI', 8), 
-                bg='#dbeafe', fg='#1e40af').pack(anchor='w', padx=10, pady=(6, 2))
-        sr_label = tk.Label(sr_card, text="", font=('Segoe UI', 12, 'bold'),
-                           bg='#dbeafe', fg='#1e293b')
-        sr_label.pack(anchor='w', padx=10, pady=(0, 6))
-        
-        # Reference card
-        ref_card = tk.Frame(info_frame, bg='#e0e7ff', relief=tk.FLAT)
-        ref_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        
-        tk.Label(ref_card, text="Reference", font=('Segoe UI', 8), 
-                bg='#e0e7ff', fg='#4338ca').pack(anchor='w', padx=10, pady=(6, 2))
-        ref_label = tk.Label(ref_card, text="", font=('Segoe UI', 12, 'bold'),
-                            bg='#e0e7ff', fg='#1e293b')
-        ref_label.pack(anchor='w', padx=10, pady=(0, 6))
-        
-        # Status card
-        status_card = tk.Frame(info_frame, bg='#fef3c7', relief=tk.FLAT)
-        status_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
-        
-        tk.Label(status_card, text="Status", font=('Segoe UI', 8), 
-                bg='#fef3c7', fg='#92400e').pack(anchor='w', padx=10, pady=(6, 2))
-        impl_label = tk.Label(status_card, text="", font=('Segoe UI', 12, 'bold'),
-                             bg='#fef3c7', fg='#1e293b')
-        impl_label.pack(anchor='w', padx=10, pady=(0, 6))
-        
-        # Content
-        content_frame = tk.Frame(dlg, bg='white', relief=tk.FLAT)
-        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=8)
-        
-        tk.Label(content_frame, text="Punch Description:", font=('Segoe UI', 9, 'bold'),
-                bg='white', fg='#64748b', anchor='w').pack(fill=tk.X, padx=15, pady=(8, 3))
-        
-        text_widget = tk.Text(content_frame, wrap=tk.WORD, height=9,
-                             font=('Segoe UI', 10), bg='#f8fafc',
-                             relief=tk.FLAT, padx=10, pady=8)
-        text_widget.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
-        text_widget.config(state=tk.DISABLED)
+        # The open count is only valid against the file as it is now; read it before
+        # openworkingxl() takes the workbook out of the cache
+        count_key = os.path.abspath(self.excel_file)
+        count_hint = [self._open_count_cache.get(count_key)]
+        if count_hint[0] and count_hint[0][0] != self._excel_stat_key(self.excel_file):
+            count_hint[0] = None
+
+        try:
+            wb = self.openworkingxl()
+            ws = wb[self.punch_sheet_name]
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open punch sheet:\n{e}")
+            return
+
+        ui = self._punch_dlg
+        if ui is None or not ui['dlg'].winfo_exists():
+            ui = self._punch_dlg = self._build_punch_dialog()
+        dlg = ui['dlg']
+        done = ui['done']
+        btns = ui['btns']
+        idx_label = ui['idx_label']
+        sr_label = ui['sr_label']
+        ref_label = ui['ref_label']
+        impl_label = ui['impl_label']
+        text_widget = ui['text_widget']
 
         pos = [0]
 
+        # Index annotations by SR No and Excel row once; the dialog never adds or removes any.
+        # The earliest match wins, as with a linear scan over self.annotations
+        sr_idx = {}
+        row_idx = {}
+        for i, a in enumerate(self.annotations):
+            sr_idx.setdefault(a.get('sr_no'), (i, a))
+            row_idx.setdefault(a.get('excel_row'), (i, a))
+
+        def find_ann(p):
+            hits = [h for h in (sr_idx.get(p['sr_no']), row_idx.get(p['row'])) if h]
+            return min(hits, key=lambda h: h[0])[1] if hits else None
+
+        def render(p):
+            """Description pane text for one punch."""
+            parts = ['' if p['punch_text'] is None else str(p['punch_text']),
+                     "\n\n──────────────────\n",
+                     f"Category: {p['category']}\n"]
+            ann = find_ann(p)
+            if ann and ann.get('quality_remark'):
+                parts += ["\n──────────────────\n", "Quality Remarks:\n", ann['quality_remark']]
+            return ''.join(parts)
+
+        # Everything show_item() displays is formatted once up front; Next/Previous only
+        # swap in the prepared values
+        total = len(punches)
+        rendered = [render(p) for p in punches]
+        cards = [(str(p['sr_no']), str(p['ref_no']),
+                  "✓ Implemented" if p['implemented'] else "⚠ Not Implemented",
+                  '#10b981' if p['implemented'] else '#f59e0b') for p in punches]
+
         def show_item():
-            p = punches[pos[0]]
+            i = pos[0]
+            sr_text, ref_text, impl_status, impl_color = cards[i]
             
             # Update progress
-            progress_text = f"Item {pos[0]+1} of {len(punches)}"
-            progress_pct = f"({int((pos[0]+1)/len(punches)*100)}% complete)"
-            idx_label.config(text=f"{progress_text} {progress_pct}")
+            idx_label.config(text=f"Item {i+1} of {total} ({int((i+1)/total*100)}% complete)")
             
             # Update info cards
-            sr_label.config(text=str(p['sr_no']))
-            ref_label.config(text=str(p['ref_no']))
-            
-            impl_status = "✓ Implemented" if p['implemented'] else "⚠ Not Implemented"
-            impl_color = '#10b981' if p['implemented'] else '#f59e0b'
+            sr_label.config(text=sr_text)
+            ref_label.config(text=ref_text)
             impl_label.config(text=impl_status, fg=impl_color)
             
             # Update description
             text_widget.config(state=tk.NORMAL)
             text_widget.delete("1.0", tk.END)
-            text_widget.insert(tk.END, p['punch_text'])
-            text_widget.insert(tk.END, f"\n\n──────────────────\n")
-            text_widget.insert(tk.END, f"Category: {p['category']}\n")
-
-            # Find annotation
-            ann = next((a for a in self.annotations 
-                       if a.get('sr_no') == p['sr_no'] 
-                       or (a.get('excel_row') == p['row'])), None)
-            
-            if ann and ann.get('quality_remark'):
-                text_widget.insert(tk.END, f"\n──────────────────\n")
-                text_widget.insert(tk.END, "Quality Remarks:\n")
-                text_widget.insert(tk.END, ann['quality_remark'])
-
+            text_widget.insert(tk.END, rendered[i])
             text_widget.config(state=tk.DISABLED)
 
         show_item()
@@ -3971,9 +4545,7 @@ class CircuitInspector:
             """Add quality-side remark"""
             p = punches[pos[0]]
             
-            ann = next((a for a in self.annotations 
-                       if a.get('sr_no') == p['sr_no'] 
-                       or (a.get('excel_row') == p['row'])), None)
+            ann = find_ann(p)
             
             current_remark = ann.get('quality_remark', '') if ann else ''
             
@@ -3987,11 +4559,67 @@ class CircuitInspector:
             if remark is not None:
                 if ann:
                     ann['quality_remark'] = remark
+                    # Several punches can resolve to the same annotation
+                    for i, q in enumerate(punches):
+                        if find_ann(q) is ann:
+                            rendered[i] = render(q)
                     messagebox.showinfo("Success", "Quality remark added successfully!")
                     show_item()
                 else:
                     messagebox.showwarning("Warning", "No annotation found for this punch item.")
 
+        # Closures are kept in the open workbook and saved every _PUNCH_SAVE_EVERY items
+        # and when the dialog closes
+        pending = [0]
+        newly_closed = [0]
+        discarded = [False]
+
+        def flush():
+            if not pending[0]:
+                return True
+            try:
+                # Stays out of the cache until the dialog closes, so closures made
+                # after this checkpoint can't reach another writer if discarded
+                self.saveworkingxl(wb, release=False)
+            except PermissionError:
+                messagebox.showerror("File Locked", 
+                                   " Please close the Excel file and try again.",
+                                   parent=dlg)
+                return False
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to close punch:\n{e}",
+                                   parent=dlg)
+                return False
+
+            # Carry the open count forward instead of rescanning on the next countopen()
+            if count_hint[0]:
+                count_hint[0] = (self._excel_stat_key(self.excel_file),
+                                 max(count_hint[0][1] - newly_closed[0], 0))
+                self._open_count_cache[count_key] = count_hint[0]
+            pending[0] = 0
+            newly_closed[0] = 0
+            self._schedule_stats_sync()
+            return True
+
+        def hide():
+            # Pooled window: hide it and end the wait instead of destroying it
+            dlg.grab_release()
+            dlg.withdraw()
+            done.set(True)
+
+        def close_dialog(retry=True):
+            # retry=False: the caller's flush() just failed and reported why
+            if (retry and flush()) or messagebox.askyesno(
+                "Discard Changes",
+                "Punch closures could not be saved.\nClose and discard them?",
+                parent=dlg
+            ):
+                discarded[0] = bool(pending[0])
+                pending[0] = 0
+                hide()
+                return True
+            return False
+
         def close_punch():
             p = punches[pos[0]]
 
@@ -4001,52 +4629,53 @@ class CircuitInspector:
             if not name:
                 return
 
-            try:
-                wb = load_workbook(self.excel_file)
-                ws = wb[self.punch_sheet_name]
+            # Same "YYYY-MM-DD HH:MM:SS" text as strftime, without the locale-aware path
+            closed_date = datetime.now().isoformat(sep=' ', timespec='seconds')
 
+            try:
                 self.writecell(ws, p['row'], self.punch_cols['closed_name'], name)
-                self.writecell(ws, p['row'], self.punch_cols['closed_date'], 
-                              datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-
-                wb.save(self.excel_file)
-                wb.close()
-
-            except PermissionError:
-                messagebox.showerror("File Locked", 
-                                   " Please close the Excel file and try again.")
-                return
+                self.writecell(ws, p['row'], self.punch_cols['closed_date'], closed_date)
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to close punch:\n{e}")
+                messagebox.showerror("Error", f"Failed to close punch:\n{e}", parent=dlg)
                 return
 
+            if not p.get('closed'):
+                newly_closed[0] += 1
+            p['closed'] = True
+            pending[0] += 1
+
             # Find and convert annotation color
-            ann = next((a for a in self.annotations 
-                       if a.get('sr_no') == p['sr_no'] 
-                       or (a.get('excel_row') == p['row'])), None)
+            ann = find_ann(p)
             
             if ann:
                 if ann.get('type') == 'highlight' and ann.get('color') == 'orange':
                     ann['color'] = 'green'
                 elif ann.get('type') == 'error':
                     ann['type'] = 'ok'
+                    self._error_count -= 1
                 
                 ann['closed_by'] = name
-                ann['closed_date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                ann['closed_date'] = closed_date
             else:
                 print(f"⚠️ Warning: No annotation found for SR {p['sr_no']}")
 
-            self.display()
-            self.sync_manager_stats_only()
+            # The page is one composited image, so only a change on the visible page needs a redraw
+            if ann and ann.get('page') == self.current_page:
+                self._schedule_display()
+            if pending[0] >= self._PUNCH_SAVE_EVERY:
+                flush()
 
             if pos[0] < len(punches) - 1:
                 pos[0] += 1
                 show_item()
             else:
+                if not flush():
+                    close_dialog(retry=False)
+                    return
                 messagebox.showinfo("Complete", 
                                   f"✓ All punches closed!\n{len(punches)} items processed.",
                                   icon='info')
-                dlg.destroy()
+                hide()
                 
                 # NEW: Auto-finalize after closing dialog
                 self.root.after(100, self.autofin)
@@ -4061,6 +4690,124 @@ class CircuitInspector:
                 pos[0] -= 1
                 show_item()
 
+        btns['prev'].config(command=prev_item)
+        btns['remark'].config(command=add_remark)
+        btns['close'].config(command=close_punch)
+        btns['next'].config(command=next_item)
+        btns['cancel'].config(command=close_dialog)
+        dlg.protocol("WM_DELETE_WINDOW", close_dialog)
+
+        done.set(False)
+        dlg.deiconify()
+        dlg.transient(self.root)
+        dlg.lift()
+        dlg.grab_set()
+        try:
+            dlg.wait_variable(done)
+        finally:
+            # Last-chance flush if the dialog went away without close_dialog();
+            # a clean workbook goes back to the cache for the next edit, a discarded
+            # one never does
+            try:
+                if pending[0]:
+                    self.saveworkingxl(wb)
+                    self._schedule_stats_sync()
+                elif not discarded[0]:
+                    self.releaseworkingxl(wb)
+                else:
+                    self._drop_wb(self.excel_file)
+            except Exception as e:
+                print(f"Punch sheet save on close failed: {e}")
+            # Don't leave the last closures' stats waiting on the debounce timer
+            if self._stats_sync_after_id:
+                self._do_stats_sync()
+            # The button callbacks hold these; empty them and unhook the callbacks so
+            # the pooled window doesn't keep this session alive
+            for held in (punches, rendered, cards, sr_idx, row_idx):
+                held.clear()
+            if dlg.winfo_exists():
+                for btn in btns.values():
+                    btn.config(command='')
+                dlg.protocol("WM_DELETE_WINDOW", hide)
+
+    def _build_punch_dialog(self):
+        """
+        Build the punch-closing window once; punchclosing() re-shows it and rewires the
+        buttons for each session instead of rebuilding the widget tree.
+        """
+        fonts = self._fonts
+
+        # Modern dialog window
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Punch Closing Mode")
+        dlg.geometry("950x650")
+        dlg.configure(bg='#f8fafc')
+        dlg.withdraw()
+        
+        # Header
+        header_frame = tk.Frame(dlg, bg='#1e293b', height=50)
+        header_frame.pack(fill=tk.X)
+        header_frame.pack_propagate(False)
+        
+        tk.Label(header_frame, text="Punch Closing Mode", 
+                bg='#1e293b', fg='white', 
+                font=fonts['title_13']).pack(pady=12)
+        
+        # Progress
+        progress_frame = tk.Frame(dlg, bg='#f8fafc')
+        progress_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
+        
+        idx_label = tk.Label(progress_frame, text="", font=fonts['bold_10'],
+                            bg='#f8fafc', fg='#1e293b')
+        idx_label.pack()
+        
+        # Info cards
+        info_frame = tk.Frame(dlg, bg='#f8fafc')
+        info_frame.pack(fill=tk.X, padx=20, pady=8)
+        
+        # SR Number card
+        sr_card = tk.Frame(info_frame, bg='#dbeafe', relief=tk.FLAT)
+        sr_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        tk.Label(sr_card, text="SR No.", font=fonts['label_8'], 
+                bg='#dbeafe', fg='#1e40af').pack(anchor='w', padx=10, pady=(6, 2))
+        sr_label = tk.Label(sr_card, text="", font=fonts['bold_12'],
+                           bg='#dbeafe', fg='#1e293b')
+        sr_label.pack(anchor='w', padx=10, pady=(0, 6))
+        
+        # Reference card
+        ref_card = tk.Frame(info_frame, bg='#e0e7ff', relief=tk.FLAT)
+        ref_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        tk.Label(ref_card, text="Reference", font=fonts['label_8'], 
+                bg='#e0e7ff', fg='#4338ca').pack(anchor='w', padx=10, pady=(6, 2))
+        ref_label = tk.Label(ref_card, text="", font=fonts['bold_12'],
+                            bg='#e0e7ff', fg='#1e293b')
+        ref_label.pack(anchor='w', padx=10, pady=(0, 6))
+        
+        # Status card
+        status_card = tk.Frame(info_frame, bg='#fef3c7', relief=tk.FLAT)
+        status_card.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        tk.Label(status_card, text="Status", font=fonts['label_8'], 
+                bg='#fef3c7', fg='#92400e').pack(anchor='w', padx=10, pady=(6, 2))
+        impl_label = tk.Label(status_card, text="", font=fonts['bold_12'],
+                             bg='#fef3c7', fg='#1e293b')
+        impl_label.pack(anchor='w', padx=10, pady=(0, 6))
+        
+        # Content
+        content_frame = tk.Frame(dlg, bg='white', relief=tk.FLAT)
+        content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=8)
+        
+        tk.Label(content_frame, text="Punch Description:", font=fonts['bold_9'],
+                bg='white', fg='#64748b', anchor='w').pack(fill=tk.X, padx=15, pady=(8, 3))
+        
+        text_widget = tk.Text(content_frame, wrap=tk.WORD, height=9,
+                             font=fonts['text_10'], bg='#f8fafc',
+                             relief=tk.FLAT, padx=10, pady=8)
+        text_widget.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 10))
+        text_widget.config(state=tk.DISABLED)
+
         # Buttons
         btn_frame = tk.Frame(dlg, bg='#f8fafc', height=80)
         btn_frame.pack(fill=tk.X, padx=20, pady=(10, 25))
@@ -4069,34 +4816,40 @@ class CircuitInspector:
         btn_container = tk.Frame(btn_frame, bg='#f8fafc')
         btn_container.pack(expand=True)
         
-        btn_style = {
-            'font': ('Segoe UI', 12, 'bold'),
-            'relief': tk.FLAT,
-            'borderwidth': 0,
-            'cursor': 'hand2',
-            'padx': 35,
-            'pady': 18,
-            'width': 15
-        }
+        btn_style = {**self._PUNCH_BTN_STYLE, 'font': fonts['bold_12']}
+        btns = {}
 
-        tk.Button(btn_container, text="<- Previous", command=prev_item, 
-                 bg='#94a3b8', fg='white', **btn_style).pack(side=tk.LEFT, padx=8)
+        btns['prev'] = tk.Button(btn_container, text="<- Previous", 
+                 bg='#94a3b8', fg='white', **btn_style)
+        btns['prev'].pack(side=tk.LEFT, padx=8)
         
-        tk.Button(btn_container, text="+ Add Remark", command=add_remark, 
-                 bg='#3b82f6', fg='white', **btn_style).pack(side=tk.LEFT, padx=8)
+        btns['remark'] = tk.Button(btn_container, text="+ Add Remark", 
+                 bg='#3b82f6', fg='white', **btn_style)
+        btns['remark'].pack(side=tk.LEFT, padx=8)
         
         close_btn_style = btn_style.copy()
         close_btn_style['width'] = 18
-        tk.Button(btn_container, text="✓  CLOSE PUNCH", command=close_punch, 
-                 bg='#10b981', fg='white', **close_btn_style).pack(side=tk.LEFT, padx=8)
+        btns['close'] = tk.Button(btn_container, text="✓  CLOSE PUNCH", 
+                 bg='#10b981', fg='white', **close_btn_style)
+        btns['close'].pack(side=tk.LEFT, padx=8)
         
-        tk.Button(btn_container, text="Next ->", command=next_item, 
-                 bg='#94a3b8', fg='white', **btn_style).pack(side=tk.LEFT, padx=8)
+        btns['next'] = tk.Button(btn_container, text="Next ->", 
+                 bg='#94a3b8', fg='white', **btn_style)
+        btns['next'].pack(side=tk.LEFT, padx=8)
         
-        tk.Button(btn_container, text="Cancel", command=dlg.destroy, 
-                 bg='#64748b', fg='white', **btn_style).pack(side=tk.LEFT, padx=8)
+        btns['cancel'] = tk.Button(btn_container, text="Cancel", 
+                 bg='#64748b', fg='white', **btn_style)
+        btns['cancel'].pack(side=tk.LEFT, padx=8)
 
-        dlg.wait_window()
+        # punchclosing() waits on this; a destroyed window (app exit) must release it too
+        done = tk.BooleanVar(master=self.root, value=False)
+        dlg.bind('<Destroy>', lambda e: e.widget is dlg and done.set(True))
+
+        return {
+            'dlg': dlg, 'done': done, 'btns': btns,
+            'idx_label': idx_label, 'sr_label': sr_label, 'ref_label': ref_label,
+            'impl_label': impl_label, 'text_widget': text_widget,
+        }
 
     def autofin(self):
         """Automatically finalize cabinet if all punches are closed
@@ -4110,78 +4863,92 @@ class CircuitInspector:
         if not self.pdf_document or not self.cabinet_id:
             return
         
-        # Check open punches
-        open_punches = self.countopen()
-        
-        if open_punches > 0:
-            print(f" Cannot auto-finalize: {open_punches} open punch(es) remaining")
-            return
-        
-        print("OK All punches closed - checking checklist...")
-        
-        # Check checklist completion
-        is_complete, pending_count = self.checklistcomp()
-        
-        if not is_complete:
-            print(f" Checklist incomplete: {pending_count} item(s) pending")
+        cabinet_id = self.cabinet_id
+
+        def check():
+            open_punches = self.countopen()
+            return open_punches, (self.checklistcomp() if open_punches == 0 else None)
+
+        def rechecked(result):
+            if result is None or self.cabinet_id != cabinet_id:
+                return
+            is_complete, pending_count = result
             
-            # Ask user if they want to complete checklist now
-            proceed = messagebox.askyesno(
-                "Checklist Incomplete",
-                f" {pending_count} checklist item(s) not reviewed.\n\n"
-                "Would you like to complete the checklist now?",
-                icon='warning'
-            )
+            if not is_complete:
+                messagebox.showinfo(
+                    "Checklist Still Incomplete",
+                    "Cabinet cannot be finalized until checklist is complete."
+                )
+                return
+            finalize()
+
+        def checked(result):
+            if result is None or self.cabinet_id != cabinet_id:
+                return
+            open_punches, checklist = result
             
-            if proceed:
-                # Open checklist review dialog
-                self.reviewnow()
+            if open_punches > 0:
+                print(f" Cannot auto-finalize: {open_punches} open punch(es) remaining")
+                return
+            
+            print("OK All punches closed - checking checklist...")
+            
+            # Check checklist completion
+            is_complete, pending_count = checklist
+            
+            if not is_complete:
+                print(f" Checklist incomplete: {pending_count} item(s) pending")
                 
-                # After review, check again
-                is_complete, pending_count = self.checklistcomp()
+                # Ask user if they want to complete checklist now
+                proceed = messagebox.askyesno(
+                    "Checklist Incomplete",
+                    f" {pending_count} checklist item(s) not reviewed.\n\n"
+                    "Would you like to complete the checklist now?",
+                    icon='warning'
+                )
                 
-                if not is_complete:
-                    messagebox.showinfo(
-                        "Checklist Still Incomplete",
-                        "Cabinet cannot be finalized until checklist is complete."
-                    )
-                    return
-            else:
+                if proceed:
+                    # Open checklist review dialog
+                    self.reviewnow()
+                    
+                    # After review, check again; only the yes/no answer is needed now
+                    self.excelbg(lambda: self.checklistcomp(early_exit=True), rechecked,
+                                 "Checking checklist...")
                 return
+            finalize()
+
+        def finalize():
+            print(" Checklist complete - auto-finalizing cabinet...")
         
-        print(" Checklist complete - auto-finalizing cabinet...")
-        
-        try:
-            # 1. Save session
-            self.savesession()
+            try:
+                # 1. Save session
+                self.savesession()
             
-            # 2. Save Interphase Excel
-            interphase_path = os.path.join(
-                self.project_dirs["interphase_export"],
-                f"{self.cabinet_id.replace(' ', '_')}_Interphase.xlsx"
-            )
+                # 2. Save Interphase Excel
+                interphase_path = os.path.join(
+                    self.project_dirs["interphase_export"],
+                    f"{self.cabinet_id.replace(' ', '_')}_Interphase.xlsx"
+                )
             
-            try:
-                shutil.copy2(self.excel_file, interphase_path)
-                print(f"Interphase Excel saved: {interphase_path}")
-            except Exception as e:
-                print(f"Failed to save Interphase Excel: {e}")
+                try:
+                    clone_file(self.excel_file, interphase_path)
+                    print(f"Interphase Excel saved: {interphase_path}")
+                except Exception as e:
+                    print(f"Failed to save Interphase Excel: {e}")
             
-            # 3. Export annotated PDF
-            self.exportpdf()
-            print("Annotated PDF exported")
+                # 3. Export annotated PDF
+                self.exportpdf()
+                print("Annotated PDF exported")
             
-            # 4. Update status to Closed
-            self.update_status_and_sync('closed')
-            print("Status updated to: Closed")
+                # 4. Update status to Closed
+                self.update_status_and_sync('closed')
+                print("Status updated to: Closed")
             
-            # 5. NEW: Remove from rework queue if present
-            username = self.logged_in_fullname or "Unknown User"
+                # 5. NEW: Remove from rework queue if present
+                username = self.logged_in_fullname or "Unknown User"
             
-            try:
-                if self.handover_db.is_in_rework_queue(self.cabinet_id):
-                    print(f" {self.cabinet_id} found in rework queue - removing...")
-                    
+                try:
+                    # The UPDATE only matches a pending rework item, so no separate lookup first
                     removed = self.handover_db.verify_production_item(
                         self.cabinet_id,
                         verified_by=username,
@@ -4191,17 +4958,18 @@ class CircuitInspector:
                     
                     if removed:
                         print(f" Removed {self.cabinet_id} from rework verification queue")
-                    else:
-                        print(f" Failed to remove {self.cabinet_id} from rework queue")
-            except Exception as e:
-                print(f" Error removing from rework queue: {e}")
+                except Exception as e:
+                    print(f" Error removing from rework queue: {e}")
             
-            # 6. Show success message
+                # 6. Show success message
             
-        except Exception as e:
-            messagebox.showerror("Finalization Error", f"Failed to finalize cabinet:\n{e}")
-            import traceback
-            traceback.print_exc()
+            except Exception as e:
+                messagebox.showerror("Finalization Error", f"Failed to finalize cabinet:\n{e}")
+                import traceback
+                traceback.print_exc()
+
+        # Excel reads run off the Tk thread; the rest continues in checked()
+        self.excelbg(check, checked, "Checking punches and checklist...")
 
     # UPDATED: handover_to_production - with checklist check and queue management
     def handover(self):
@@ -4227,122 +4995,133 @@ class CircuitInspector:
             if not proceed:
                 return
         
-        # NEW: Check checklist completion BEFORE handover
-        is_complete, pending_count = self.checklistcomp()
-        
-        if not is_complete:
-            messagebox.showwarning(
-                "Checklist Incomplete",
-                f"⚠️ Cannot handover to production.\n\n"
-                f"{pending_count} checklist item(s) not reviewed.\n\n"
-                "Please complete the checklist first.",
-                icon='warning'
-            )
+        cabinet_id = self.cabinet_id
+
+        def check(early_exit=False):
+            return self.checklistcomp(early_exit=early_exit), self.countopen()
+
+        def rechecked(result):
+            if result is None or self.cabinet_id != cabinet_id:
+                return
+            (is_complete, pending_count), open_punches = result
             
-            # Ask if they want to complete it now
-            complete_now=True
+            if not is_complete:
+                messagebox.showinfo(
+                    "Handover Cancelled",
+                    "Checklist still incomplete. Handover cancelled."
+                )
+                return
+            finish(open_punches)
+
+        def checked(result):
+            if result is None or self.cabinet_id != cabinet_id:
+                return
+            # NEW: Check checklist completion BEFORE handover
+            (is_complete, pending_count), open_punches = result
             
-            if complete_now:
-                self.reviewnow()
+            if not is_complete:
+                messagebox.showwarning(
+                    "Checklist Incomplete",
+                    f"⚠️ Cannot handover to production.\n\n"
+                    f"{pending_count} checklist item(s) not reviewed.\n\n"
+                    "Please complete the checklist first.",
+                    icon='warning'
+                )
                 
-                # Check again after review
-                is_complete, pending_count = self.checklistcomp()
+                # Ask if they want to complete it now
+                complete_now=True
                 
-                if not is_complete:
-                    messagebox.showinfo(
-                        "Handover Cancelled",
-                        "Checklist still incomplete. Handover cancelled."
-                    )
-                    return
-            else:
+                if complete_now:
+                    self.reviewnow()
+                    
+                    # Check again after review; only the yes/no answer is needed now
+                    self.excelbg(lambda: check(early_exit=True), rechecked,
+                                 "Checking checklist...")
                 return
+            finish(open_punches)
+
+        def finish(open_punches):
+            # Save session before handover
+            self.savesession()
         
-        # Count open punches
-        open_punches = self.countopen()
-        
-        
-        # Save session before handover
-        self.savesession()
-        
-        # Get user name
-        username = self.logged_in_fullname or "Unknown User"
-        
-        # Prepare handover data
-        session_path = os.path.join(
-            self.project_dirs.get("sessions", ""),
-            f"{self.cabinet_id}_annotations.json"
-        )
+            # Get user name
+            username = self.logged_in_fullname or "Unknown User"
         
-        error_highlights = [a for a in self.annotations 
-                           if a.get('type') == 'highlight' and a.get('color') == 'orange']
-        total_punches = len(error_highlights)
-        
-        handover_data = {
-            "cabinet_id": self.cabinet_id,
-            "project_name": self.project_name,
-            "sales_order_no": self.sales_order_no,
-            "pdf_path": self.current_pdf_path,
-            "excel_path": self.excel_file,
-            "session_path": session_path if os.path.exists(session_path) else None,
-            "total_punches": total_punches,
-            "open_punches": open_punches,
-            "closed_punches": total_punches - open_punches,
-            "handed_over_by": username,
-            "handed_over_date": datetime.now().isoformat()
-        }
+            # Prepare handover data
+            session_path = os.path.join(
+                self.project_dirs.get("sessions", ""),
+                f"{self.cabinet_id}_annotations.json"
+            )
         
-        # NEW: Remove from verify rework queue if present
-        try:
-            # Check if in rework queue
-            pending_items = self.handover_db.get_pending_quality_items()
-            in_rework_queue = any(item['cabinet_id'] == self.cabinet_id for item in pending_items)
-            
-            if in_rework_queue:
-                # Remove from rework queue
-                self.handover_db.verify_production_item(
-                    self.cabinet_id,
-                    verified_by=username,
-                    verification_notes="Re-opened for quality inspection"
-                )
-                print(f"OK Removed {self.cabinet_id} from verify rework queue")
-        except Exception as e:
-            print(f"⚠️ Error checking/removing from rework queue: {e}")
+            error_highlights = [a for a in self.annotations 
+                               if a.get('type') == 'highlight' and a.get('color') == 'orange']
+            total_punches = len(error_highlights)
+        
+            handover_data = {
+                "cabinet_id": self.cabinet_id,
+                "project_name": self.project_name,
+                "sales_order_no": self.sales_order_no,
+                "pdf_path": self.current_pdf_path,
+                "excel_path": self.excel_file,
+                "session_path": session_path if os.path.exists(session_path) else None,
+                "total_punches": total_punches,
+                "open_punches": open_punches,
+                "closed_punches": total_punches - open_punches,
+                "handed_over_by": username,
+                "handed_over_date": datetime.now().isoformat()
+            }
         
-        # Add to production queue
-        success = self.handover_db.add_quality_handover(handover_data)
-        self.update_status_and_sync('handed_to_production')
+            # Add to production queue; any pending rework item is verified in the same
+            # transaction (NEW: Remove from verify rework queue if present)
+            success = self.handover_db.add_quality_handover(
+                handover_data,
+                rework_verified_by=username,
+                rework_notes="Re-opened for quality inspection"
+            )
+            self.update_status_and_sync('handed_to_production')
         
-        if not success:
-            messagebox.showwarning("Already Handed Over", 
-                                 "Cabinet already in production queue")
+            if not success:
+                messagebox.showwarning("Already Handed Over", 
+                                     "Cabinet already in production queue")
+
+        # Excel reads run off the Tk thread; the rest continues in checked()
+        self.excelbg(check, checked, "Checking checklist...")
 
 
     def updatestatsforref(self, ref_no, status='NOK'):
             """Update Interphase status"""
             try:
-                wb = load_workbook(self.excel_file)
+                # Usually follows a punch write, so this reuses the workbook that was just saved
+                wb = self.openworkingxl()
                 if self.interphase_sheet_name not in wb.sheetnames:
-                    wb.close()
+                    self.releaseworkingxl(wb)
                     return False
                 ws = wb[self.interphase_sheet_name]
                 
                 updated_any = False
                 # Updated to include timestamp + date
-                current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                current_date = datetime.now().isoformat(sep=' ', timespec='seconds')
                 
                 username = self.logged_in_fullname or "Unknown User"
                 
-                for r in range(1, ws.max_row + 1):
-                    cell_val = self.readcell(ws, r, self.interphase_cols['ref_no'])
-                    if cell_val and str(cell_val).strip() == str(ref_no).strip():
-                        self.writecell(ws, r, self.interphase_cols['status'], status)
-                        self.writecell(ws, r, self.interphase_cols['name'], username)
-                        self.writecell(ws, r, self.interphase_cols['date'], current_date)
-                        updated_any = True
+                # Find matching rows in one value sweep, then touch only those cells.
+                # A merged ref cell only carries its value in the top-left row, and writecell()
+                # resolves the other rows of the merge to that same cell anyway
+                target = str(ref_no).strip()
+                match_rows = [r for r, cell_val in
+                              enumerate(self.colvalues(ws, self.interphase_cols['ref_no'], 1), start=1)
+                              if cell_val and str(cell_val).strip() == target]
+                
+                for r in match_rows:
+                    self.writecell(ws, r, self.interphase_cols['status'], status)
+                    self.writecell(ws, r, self.interphase_cols['name'], username)
+                    self.writecell(ws, r, self.interphase_cols['date'], current_date)
+                    updated_any = True
                 
                 if updated_any:
-                    wb.save(self.excel_file)
-                wb.close()
+                    self.saveworkingxl(wb)
+                else:
+                    self.releaseworkingxl(wb)
                 return updated_any
             except Exception as e:
                 print(f"Interphase update error: {e}")
@@ -4360,9 +5139,8 @@ class CircuitInspector:
                 self.savesession()
                 print(" Session auto-saved successfully")
                 
-                # Sync stats one last time
+                # Sync stats one last time; the write is awaited below
                 self.sync_manager_stats_only()
-                print(" Statistics synced")
                 
             except Exception as e:
                 print(f" Auto-save on close failed: {e}")
@@ -4375,7 +5153,14 @@ class CircuitInspector:
                 if not proceed:
                     return  # Don't close the application
         
-        # Close the application
+        # Close the application once queued stats/status writes have landed, but never
+        # hang on a stalled database connection
+        if self._sync_thread is None or self._wait_for_sync(self._SYNC_CLOSE_TIMEOUT):
+            self.manager_db.close()
+        else:
+            # The worker may still hold the shared connection, so leave it to the process exit
+            logger.warning("Statistics sync still pending after %ss; closing without it",
+                           self._SYNC_CLOSE_TIMEOUT)
         self.root.destroy()
 
     def saverecentproj(self):
@@ -4388,6 +5173,7 @@ class CircuitInspector:
                 self.project_dirs.get("sessions", ""),
                 f"{self.cabinet_id}_annotations.json"
             ) if hasattr(self, 'project_dirs') else None
+            now = datetime.now().isoformat()
             
             project_data = {
                 'cabinet_id': self.cabinet_id,
@@ -4397,13 +5183,17 @@ class CircuitInspector:
                 'pdf_path': self.current_pdf_path,
                 'excel_path': self.excel_file,
                 'session_path': session_path if session_path and os.path.exists(session_path) else None,
-                'last_accessed': datetime.now().isoformat()
+                'last_accessed': now
             }
             
-            if self.db.project_exists(self.cabinet_id):
-                self.db.update_project(self.cabinet_id, project_data)
+            # Only fields that differ from the stored row are rewritten; usually that
+            # leaves just the last_accessed bump
+            current = self.db.get_project(self.cabinet_id)
+            if current:
+                self.db.update_project(self.cabinet_id,
+                                       self.db.changed_project_fields(project_data, current))
             else:
-                project_data['created_date'] = datetime.now().isoformat()
+                project_data['created_date'] = now
                 self.db.add_project(project_data)
             
             self.updrecentdropdwn()
@@ -4421,7 +5211,8 @@ class CircuitInspector:
     def updrecentdropdwn(self):
         """Update the recent projects dropdown from database"""
         try:
-            recent_projects = self.db.get_recent_projects(limit=20)
+            # Only the labels are needed here; the full record is fetched on click
+            recent_projects = self.db.get_recent_project_labels(limit=20)
             
             menu = self.recent_dropdown['menu']
             menu.delete(0, 'end')
@@ -4430,16 +5221,28 @@ class CircuitInspector:
                 menu.add_command(label="No recent projects", command=lambda: None)
                 return
             
-            for proj in recent_projects:
-                label = f"{proj['cabinet_id']} - {proj['project_name']}"
+            for cabinet_id, project_name in recent_projects:
                 menu.add_command(
-                    label=label,
-                    command=lambda p=proj: self.loadrecentdb(p)
+                    label=f"{cabinet_id} - {project_name}",
+                    command=lambda c=cabinet_id: self.loadrecentid(c)
                 )
                 
         except Exception as e:
             print(f"Error updating recent dropdown: {e}")
 
+    def loadrecentid(self, cabinet_id):
+        """Fetch a recent project's record by cabinet ID and load it"""
+        try:
+            project_data = self.db.get_project(cabinet_id)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load project:\n{e}")
+            return
+        if not project_data:
+            messagebox.showerror("Error", f"Project {cabinet_id} is no longer in the database.")
+            self.updrecentdropdwn()
+            return
+        self.loadrecentdb(project_data)
+
 
     def loadrecentdb(self, project_data):
         """Load a recent project from database - HIGHLIGHTER VERSION"""
@@ -4492,7 +5295,7 @@ class CircuitInspector:
             self.pdf_document = fitz.open(pdf_path)
             self.current_pdf_path = pdf_path
             self.current_page = 0
-            self.annotations = []
+            self._reset_annotations()
             self.zoom_level = 1.0
             self.tool_mode = None
             
@@ -4508,27 +5311,30 @@ class CircuitInspector:
             self.working_excel_path = expected_excel_path
             self.current_sr_no = self.getnextsr()
             
-            # Load session
-            if os.path.exists(expected_session_path):
+            # Load session; remember whether it exists so the DB update below
+            # doesn't stat it again (each stat is a round trip on the UNC share)
+            session_exists = os.path.exists(expected_session_path)
+            if session_exists:
                 self.loadfrompath(expected_session_path)
             else:
                 old_session_path = project_data.get('session_path')
                 if old_session_path and os.path.exists(old_session_path):
                     try:
                         shutil.copy2(old_session_path, expected_session_path)
+                        session_exists = True
                         self.loadfrompath(expected_session_path)
                     except:
                         self.display()
                 else:
                     self.display()
             
-            # Update database
-            self.db.update_project(self.cabinet_id, {
+            # Update database; project_data is the row as loaded, so unchanged paths are skipped
+            self.db.update_project(self.cabinet_id, self.db.changed_project_fields({
                 'pdf_path': self.current_pdf_path,
                 'excel_path': expected_excel_path,
-                'session_path': expected_session_path if os.path.exists(expected_session_path) else None,
+                'session_path': expected_session_path if session_exists else None,
                 'last_accessed': datetime.now().isoformat()
-            })
+            }, project_data))
             
             
         except Exception as e:
@@ -4569,14 +5375,12 @@ class CircuitInspector:
             return False
         
         try:
-            conn = sqlite3.connect(self.manager_db.db_path)
-            cursor = conn.cursor()
-            
-            # Check if exists
-            cursor.execute('SELECT cabinet_id FROM cabinets WHERE cabinet_id = ?', (self.cabinet_id,))
-            exists = cursor.fetchone()
+            with self.manager_db.connection() as conn:
+                cursor = conn.cursor()
             
-            conn.close()
+                # Check if exists
+                cursor.execute('SELECT cabinet_id FROM cabinets WHERE cabinet_id = ?', (self.cabinet_id,))
+                exists = cursor.fetchone()
             
             if exists:
                 # Already exists, just sync stats
@@ -4584,8 +5388,8 @@ class CircuitInspector:
                 print(f"OK {self.cabinet_id} already on dashboard - stats synced")
                 return True
             else:
-                # Doesn't exist, create it
-                self.sync_manager_stats_only()  # This will create it now
+                # Doesn't exist, create it (even if these stats were synced before)
+                self.sync_manager_stats_only(force=True)  # This will create it now
                 print(f"OK {self.cabinet_id} is now visible on dashboard")
                 return True
                 
@@ -4594,172 +5398,253 @@ class CircuitInspector:
             return False
 
 
-    def countopen(self):
+    def countopen(self, excel_path=None):
         """Count open punches in current Excel
         
+        Args:
+            excel_path: Workbook to count in; defaults to the current working Excel
+        
         Returns:
             int: Number of punches that are not closed
         """
+        excel_path = excel_path or self.excel_file
         try:
-            if not self.excel_file or not os.path.exists(self.excel_file):
+            if not excel_path or not os.path.exists(excel_path):
                 return 0
             
-            wb = load_workbook(self.excel_file, data_only=True)
-            ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
-            
-            open_count = 0
-            row = 8
-            
-            while row <= ws.max_row + 5:
-                sr = self.readcell(ws, row, self.punch_cols['sr_no'])
-                if sr is None:
-                    break
-                
-                closed = self.readcell(ws, row, self.punch_cols['closed_name'])
-                if not closed:
-                    open_count += 1
-                
-                row += 1
+            # close_punch keeps this entry current, so a session of closures never rescans
+            cache_key = os.path.abspath(excel_path)
+            stat = self._excel_stat_key(excel_path)
+            cached = self._open_count_cache.get(cache_key)
+            if cached and cached[0] == stat:
+                return cached[1]
             
-            wb.close()
-            return open_count
+            return self.punchcounts(excel_path)[1]
             
         except Exception as e:
             print(f"Error counting open punches: {e}")
             return 0
+
+    def punchcounts(self, excel_path):
+        """
+        Tally the punch sheet in one streamed pass.
         
-    def sync_manager_stats_only(self, update_status_from_interphase=True):
+        Returns:
+            tuple: (total, open, implemented, closed). total/open cover every row down to
+            the first blank SR No; implemented/closed only count checked rows. The open
+            count is also stored for countopen() against the stat taken before the read.
+        """
+        cache_key = os.path.abspath(excel_path)
+        stat = self._excel_stat_key(excel_path)
+        
+        # Values only: stream the sheet read-only and release the file handle
+        wb = load_workbook(excel_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
+            
+            col = self._punch_col_idx
+            sr_idx = col['sr_no']
+            checked_idx = col['checked_name']
+            impl_idx = col['implemented_name']
+            closed_idx = col['closed_name']
+            
+            total = open_count = implemented = closed = 0
+            # From the first data row: the merged header's A8 reads as None and
+            # would end the sweep before any punch
+            for vals in ws.iter_rows(min_row=self._PUNCH_FIRST_ROW,
+                                     max_col=max(sr_idx, checked_idx, impl_idx, closed_idx) + 1,
+                                     values_only=True):
+                if vals[sr_idx] is None:
+                    break
+                total += 1
+                is_closed = vals[closed_idx]
+                if not is_closed:
+                    open_count += 1
+                if not vals[checked_idx]:
+                    continue
+                if is_closed:
+                    closed += 1
+                elif vals[impl_idx]:
+                    implemented += 1
+        finally:
+            wb.close()
+        
+        self._open_count_cache[cache_key] = (stat, open_count)
+        return total, open_count, implemented, closed
+        
+    def excelbg(self, fn, on_done, message=None):
+        """
+        Run fn (an Excel read such as countopen/checklistcomp) on a worker thread and
+        call on_done(result) back on the Tk thread; result is None if fn raised.
+        The Tk side polls for the result so the worker never touches Tk. With a message,
+        a small modal notice blocks input until the result arrives.
+        """
+        box = []
+
+        def work():
+            try:
+                box.append(fn())
+            except Exception as e:
+                print(f"Background Excel read failed: {e}")
+                box.append(None)
+
+        busy = None
+        if message:
+            busy = tk.Toplevel(self.root)
+            busy.title("Please wait")
+            busy.configure(bg='#f8fafc')
+            busy.transient(self.root)
+            busy.resizable(False, False)
+            busy.protocol("WM_DELETE_WINDOW", lambda: None)
+            tk.Label(busy, text=message, font=('Segoe UI', 10),
+                    bg='#f8fafc', fg='#1e293b', padx=30, pady=18).pack()
+            try:
+                busy.wait_visibility()
+                busy.grab_set()
+            except tk.TclError:
+                pass
+
+        def poll():
+            if not box:
+                self.root.after(30, poll)
+                return
+            if busy is not None:
+                busy.destroy()
+            on_done(box[0])
+
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(30, poll)
+
+    def sync_manager_stats_only(self, update_status_from_interphase=True, force=False, status=None):
         """Sync statistics and optionally update status from Interphase
         
+        Annotation counts are taken here on the Tk thread; the Excel tallies and the
+        database write run on a background worker that coalesces bursts per cabinet.
+        A sync whose inputs (counts, project fields, Excel stat) match the last one is skipped.
+        Use _wait_for_sync() to wait for queued writes (onclosing() does, with a timeout).
+        
         Args:
             update_status_from_interphase: If True, recalculate status from Interphase worksheet
+            force: If True, write even when nothing changed since the last sync
+            status: Explicit status to write with the stats (see update_status_and_sync)
         """
         if not self.pdf_document or not self.cabinet_id:
             return
         
+        job = {
+            'cabinet_id': self.cabinet_id,
+            'project_name': self.project_name,
+            'sales_order_no': self.sales_order_no,
+            'storage_location': getattr(self, 'storage_location', None),
+            'excel_file': self.excel_file,
+            # Both counts are kept current by _add_ann/_remove_ann
+            'annotated_pages': len(self._ann_pages),
+            'total_pages': len(self.pdf_document),
+            'total_punches': self._error_count,
+            'update_status_from_interphase': update_status_from_interphase,
+            'set_status': status,
+        }
         try:
-            # Count pages with annotations
-            annotated_pages = len(set(ann['page'] for ann in self.annotations 
-                                     if ann.get('page') is not None))
-            total_pages = len(self.pdf_document)
-            
-            # Count punches
-            error_anns = [a for a in self.annotations if a.get('type') == 'error']
-            total_punches = len(error_anns)
-            open_punches = self.countopen()
+            excel_stat = self._excel_stat_key(self.excel_file) if self.excel_file else None
+        except OSError:
+            excel_stat = None
+        sync_key = (tuple(job.values()), excel_stat)
+        if not force and status is None and sync_key == self._last_sync_key:
+            return
+        self._last_sync_key = sync_key
+        
+        self._sync_queue.put(job)
+        if self._sync_thread is None:
+            self._sync_thread = threading.Thread(target=self._sync_worker, daemon=True)
+            self._sync_thread.start()
+
+    def _wait_for_sync(self, timeout=None):
+        """Wait for queued syncs to be written; False if timeout (seconds) ran out first."""
+        q = self._sync_queue
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout)
+
+    def _sync_worker(self):
+        while True:
+            jobs = [self._sync_queue.get()]
+            # Coalesce a burst: only the newest snapshot per cabinet is written
+            while True:
+                try:
+                    jobs.append(self._sync_queue.get_nowait())
+                except queue.Empty:
+                    break
+            latest = OrderedDict()
+            for job in jobs:
+                prev = latest.pop(job['cabinet_id'], None)
+                # An explicit status survives being coalesced into a later plain snapshot
+                if prev and prev['set_status'] and not job['set_status']:
+                    job = dict(job, set_status=prev['set_status'])
+                latest[job['cabinet_id']] = job
+            try:
+                for job in latest.values():
+                    self._write_manager_stats(job)
+            finally:
+                for _ in jobs:
+                    self._sync_queue.task_done()
+
+    def _write_manager_stats(self, job):
+        """Worker side of sync_manager_stats_only(): Excel tallies and the cabinets row."""
+        cabinet_id = job['cabinet_id']
+        excel_file = job['excel_file']
+        update_status_from_interphase = job['update_status_from_interphase']
+        set_status = job['set_status']
+        
+        try:
+            annotated_pages = job['annotated_pages']
+            total_pages = job['total_pages']
+            total_punches = job['total_punches']
             
-            # Count implemented and closed
+            # Open, implemented and closed all come from one pass over the punch sheet
+            open_punches = 0
             implemented_punches = 0
             closed_punches = 0
             
-            if self.excel_file and os.path.exists(self.excel_file):
+            if excel_file and os.path.exists(excel_file):
                 try:
-                    from openpyxl import load_workbook
-                    wb = load_workbook(self.excel_file, data_only=True)
-                    ws = wb[self.punch_sheet_name] if self.punch_sheet_name in wb.sheetnames else wb.active
-                    
-                    row = 8
-                    while row <= ws.max_row + 5:
-                        checked = self.readcell(ws, row, self.punch_cols['checked_name'])
-                        
-                        if checked:
-                            implemented = self.readcell(ws, row, self.punch_cols['implemented_name'])
-                            closed = self.readcell(ws, row, self.punch_cols['closed_name'])
-                            
-                            if closed:
-                                closed_punches += 1
-                            elif implemented:
-                                implemented_punches += 1
-                        
-                        row += 1
-                        if row > 2000:
-                            break
-                    
-                    wb.close()
+                    _, open_punches, implemented_punches, closed_punches = self.punchcounts(excel_file)
                 except Exception as e:
-                    print(f"Error counting punches: {e}")
-            
-            # Determine status
-            conn = sqlite3.connect(self.manager_db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT status FROM cabinets WHERE cabinet_id = ?', (self.cabinet_id,))
-            existing = cursor.fetchone()
-            excel_path_db = to_relative_path(self.excel_file)
-            storage_location_db = to_relative_storage_location(getattr(self, 'storage_location', None))
-            
-            if existing:
-                # Cabinet exists - get current status
-                current_status = existing[0]
-                
-                # Update status from Interphase if requested AND if status is workflow-related
-                workflow_statuses = [
-                    'project_info_sheet',
-                    'mechanical_assembly', 
-                    'component_assembly',
-                    'final_assembly',
-                    'final_documentation',
-                    'quality_inspection'
-                ]
-                
-                if update_status_from_interphase and current_status in workflow_statuses:
-                    new_status = self.get_status_from_interphase(self.excel_file)
-                    if new_status:
-                        current_status = new_status
-                        print(f"OK Status updated from Interphase: {new_status}")
-                
-                # Update with potentially new status
-                cursor.execute('''
-                    UPDATE cabinets 
-                    SET total_pages = ?,
-                        annotated_pages = ?,
-                        total_punches = ?,
-                        open_punches = ?,
-                        implemented_punches = ?,
-                        closed_punches = ?,
-                        status = ?,
-                        last_updated = ?,
-                        excel_path = ?,
-                        storage_location = ?
-                    WHERE cabinet_id = ?
-                ''', (total_pages, annotated_pages, total_punches, open_punches,
-                      implemented_punches, closed_punches, current_status,
-                        datetime.now().isoformat(), excel_path_db,
-                        storage_location_db, self.cabinet_id))
-                
-                print(f"OK Updated {self.cabinet_id} - Status: {current_status}")
-            else:
-                # Cabinet doesn't exist - create with initial status from Interphase
-                initial_status = self.get_status_from_interphase(self.excel_file)
-                if not initial_status:
-                    initial_status = 'quality_inspection'
-                
-                cursor.execute('''
-                    INSERT INTO cabinets (
-                        cabinet_id, project_name, sales_order_no,
-                        total_pages, annotated_pages, total_punches,
-                        open_punches, implemented_punches, closed_punches,
-                        status, created_date, last_updated,
-                        storage_location, excel_path
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    self.cabinet_id, self.project_name, self.sales_order_no,
+                    logger.warning("Error counting punches: %s", e)
+                    self._last_sync_key = None  # let the next sync retry the tally
+            
+            # Determine status: a new row starts from the Interphase status (or
+            # quality_inspection); an existing row only follows Interphase while it is
+            # still in a workflow status and the caller asked for it. An explicit
+            # set_status (handover, closing, ...) overrides both
+            interphase_status = self.get_status_from_interphase(excel_file)
+            initial_status = set_status or interphase_status or 'quality_inspection'
+            follow_status = interphase_status if update_status_from_interphase else None
+            excel_path_db = to_relative_path(excel_file)
+            storage_location_db = to_relative_storage_location(job['storage_location'])
+            now = datetime.now().isoformat()
+            
+            # One statement whether or not the cabinet exists yet; xmax = 0 marks a fresh insert
+            with self.manager_db.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(self._CABINET_UPSERT_SQL, (
+                    cabinet_id, job['project_name'], job['sales_order_no'],
                     total_pages, annotated_pages, total_punches,
                     open_punches, implemented_punches, closed_punches,
-                    initial_status, datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                    storage_location_db, excel_path_db
+                    initial_status, now, now,
+                    storage_location_db, excel_path_db,
+                    set_status, *self._WORKFLOW_STATUSES, follow_status
                 ))
-                
-                print(f"Created {self.cabinet_id} with status: {initial_status}")
+                current_status, created = cursor.fetchone()
             
-            conn.commit()
-            conn.close()
+            if set_status:
+                logger.info("OK Status manually updated to: %s", set_status)
+            if created:
+                logger.info("Created %s with status: %s", cabinet_id, current_status)
+            else:
+                logger.info("OK Updated %s - Status: %s", cabinet_id, current_status)
             
         except Exception as e:
-            print(f"Stats sync error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Stats sync error: %s", e)
+            self._last_sync_key = None  # the row was not written; do not skip the next sync
 
 
     def get_status_from_interphase(self, excel_path):
@@ -4770,64 +5655,118 @@ class CircuitInspector:
         if not excel_path or not os.path.exists(excel_path):
             return None
         
+        # The status only changes when the file does; every sync asks for it
+        cache_key = os.path.abspath(excel_path)
+        try:
+            stat = self._excel_stat_key(excel_path)
+        except OSError:
+            return None
+        cached = self._interphase_status_cache.get(cache_key)
+        if cached and cached[0] == stat:
+            return cached[1]
+        
+        status = self._read_interphase_status(excel_path)
+        # A failed read (e.g. file mid-save) is retried next time rather than remembered
+        if status is not None:
+            self._interphase_status_cache[cache_key] = (stat, status)
+        return status
+
+    def _interphase_rows(self, excel_path):
+        """
+        (reference, status) from columns B and D of the Interphase sheet, row 11 down,
+        with merged cells reading as their top-left value. None if there is no such sheet.
+        
+        Uses python-calamine when it is installed and reports the sheet's merged ranges;
+        otherwise a private openpyxl workbook, so the stats worker never shares the
+        Tk thread's cached workbooks.
+        """
+        if _CalamineWorkbook is not None:
+            wb = _CalamineWorkbook.from_path(excel_path)
+            try:
+                if 'Interphase' not in wb.sheet_names:
+                    return None
+                sheet = wb.get_sheet_by_name('Interphase')
+                merged = getattr(sheet, 'merged_cell_ranges', None)
+                if merged is not None:
+                    return self._calamine_interphase_rows(sheet, merged)
+            finally:
+                close = getattr(wb, 'close', None)
+                if close:
+                    close()
+        
+        # Not read-only: the merged ranges are needed
+        wb = load_workbook(excel_path, data_only=True, keep_links=False)
         try:
-            from openpyxl import load_workbook
-            wb = load_workbook(excel_path, data_only=True)
-            
             if 'Interphase' not in wb.sheetnames:
-                wb.close()
                 return None
-            
             ws = wb['Interphase']
             
+            # Cells covered by a merge read as the merge's top-left value, like readcell()
+            fill = {}
+            for merged in ws.merged_cells.ranges:
+                for c in (2, 4):
+                    if merged.min_col <= c <= merged.max_col:
+                        top = ws.cell(row=merged.min_row, column=merged.min_col).value
+                        for r in range(max(merged.min_row, 11), merged.max_row + 1):
+                            fill[(r, c)] = top
+            
+            # Only columns B..D are swept, one value tuple per row
+            return [(fill.get((r, 2), ref), fill.get((r, 4), status))
+                    for r, (ref, _, status) in enumerate(
+                        ws.iter_rows(min_row=11, min_col=2, max_col=4, values_only=True), start=11)]
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _calamine_interphase_rows(sheet, merged):
+        """Rows 11+ of columns B/D from a calamine sheet (0-based cells, no DOM)."""
+        grid = sheet.to_python(skip_empty_area=False)
+        
+        def cell(r, c):
+            row = grid[r] if r < len(grid) else ()
+            value = row[c] if c < len(row) else None
+            # calamine hands back whole numbers as floats; openpyxl gives ints
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            return value
+        
+        # Cells covered by a merge read as the merge's top-left value, like readcell()
+        fill = {}
+        for (r0, c0), (r1, c1) in merged:
+            for c in (1, 3):
+                if c0 <= c <= c1:
+                    top = cell(r0, c0)
+                    for r in range(max(r0, 10), r1 + 1):
+                        fill[(r, c)] = top
+        
+        return [(fill.get((r, 1), cell(r, 1)), fill.get((r, 3), cell(r, 3)))
+                for r in range(10, len(grid))]
+
+    def _read_interphase_status(self, excel_path):
+        """Uncached body of get_status_from_interphase()."""
+        try:
+            rows = self._interphase_rows(excel_path)
+            if rows is None:
+                return None
+            
             # Find the HIGHEST reference number that has a status
             highest_ref_num = 0
             
             # Start from row 11 (typical Interphase data starts here)
-            for row in range(11, ws.max_row + 1):
-                status_cell = self.readcell(ws, row, 'D')  # Status column
-                
+            for ref_no_cell, status_cell in rows:
                 # If status cell has content, check the reference number
                 if status_cell and str(status_cell).strip():
-                    ref_no_cell = self.readcell(ws, row, 'B')  # Reference column
-                    
                     if ref_no_cell:
-                        try:
-                            ref_str = str(ref_no_cell).strip()
-                            
-                            # Handle range formats like "1-2" - take the LAST number
-                            if '-' in ref_str:
-                                ref_num = int(ref_str.split('-')[-1])
-                            else:
-                                ref_num = int(ref_str)
-                            
-                            # Track highest completed reference
-                            if ref_num > highest_ref_num:
-                                highest_ref_num = ref_num
-                        
-                        except (ValueError, IndexError):
-                            continue
-            
-            wb.close()
+                        # Track highest completed reference
+                        ref_num = interphase_ref_num(ref_no_cell)
+                        if ref_num is not None and ref_num > highest_ref_num:
+                            highest_ref_num = ref_num
             
             # Determine status based on highest completed reference number
-            if highest_ref_num == 0:
-                return 'quality_inspection'  # Nothing completed yet
-            elif 1 <= highest_ref_num <= 2:
-                return 'project_info_sheet'
-            elif 3 <= highest_ref_num <= 9:
-                return 'mechanical_assembly'
-            elif 10 <= highest_ref_num <= 18:
-                return 'component_assembly'
-            elif 19 <= highest_ref_num <= 26:
-                return 'final_assembly'
-            elif highest_ref_num >= 27:
-                return 'final_documentation'
-            else:
-                return 'quality_inspection'
+            return interphase_status_for(highest_ref_num)
             
         except Exception as e:
-            print(f"Error reading Interphase worksheet: {e}")
+            logger.warning("Error reading Interphase worksheet: %s", e)
             return None
 
 
@@ -4837,30 +5776,32 @@ class CircuitInspector:
         Use this for manual status changes (handover, closing, etc.)
         This will NOT be overridden by Interphase status.
         
+        The status is written by the stats worker in the same statement as the
+        stats, so the caller (a Tk handler) does not wait on the database.
+        
         Args:
             new_status: One of the valid status strings
         """
+        if self.pdf_document and self.cabinet_id:
+            self.sync_manager_stats_only(update_status_from_interphase=False, status=new_status)
+            return
+        
+        # No project snapshot to sync; just set the status
         try:
-            conn = sqlite3.connect(self.manager_db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE cabinets 
-                SET status = ?, 
-                    last_updated = ?
-                WHERE cabinet_id = ?
-            ''', (new_status, datetime.now().isoformat(), self.cabinet_id))
+            with self.manager_db.connection() as conn:
+                cursor = conn.cursor()
             
-            conn.commit()
-            conn.close()
-            
-            print(f"OK Status manually updated to: {new_status}")
+                cursor.execute('''
+                    UPDATE cabinets 
+                    SET status = ?, 
+                        last_updated = ?
+                    WHERE cabinet_id = ?
+                ''', (new_status, datetime.now().isoformat(), self.cabinet_id))
             
-            # Now sync stats without changing status
-            self.sync_manager_stats_only(update_status_from_interphase=False)
+            logger.info("OK Status manually updated to: %s", new_status)
             
         except Exception as e:
-            print(f"Status update error: {e}")
+            logger.warning("Status update error: %s", e)
 
 
     def get_current_status_from_db(self):
@@ -4870,14 +5811,12 @@ class CircuitInspector:
             str: Current status or 'quality_inspection' if not found
         """
         try:
-            conn = sqlite3.connect(self.manager_db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT status FROM cabinets WHERE cabinet_id = ?', 
-                          (self.cabinet_id,))
-            result = cursor.fetchone()
+            with self.manager_db.connection() as conn:
+                cursor = conn.cursor()
             
-            conn.close()
+                cursor.execute('SELECT status FROM cabinets WHERE cabinet_id = ?', 
+                              (self.cabinet_id,))
+                result = cursor.fetchone()
             
             if result:
                 return result[0]
@@ -4887,7 +5826,7 @@ class CircuitInspector:
                 return status if status else 'quality_inspection'
                 
         except Exception as e:
-            print(f"Error getting status from DB: {e}")
+            logger.warning("Error getting status from DB: %s", e)
             return 'quality_inspection'
     
 
@@ -4897,9 +5836,14 @@ class CircuitInspector:
 # ================================================================
 
 def main():
+    log_listener = start_log_listener()
     root = tk.Tk()
     app = CircuitInspector(root)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        if log_listener:
+            log_listener.stop()
 
 
 if __name__ == "__main__":
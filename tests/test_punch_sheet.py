@@ -0,0 +1,99 @@
+"""Punch sheet sweeps against the shipped Emerson.xlsx template (header on merged rows 7-8)."""
+import os
+import shutil
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("PIL")
+pytest.importorskip("fitz")
+pytest.importorskip("numpy")
+
+import quality  # noqa: E402
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Emerson.xlsx")
+
+# (sr, ref, desc, checked, implemented, closed) written from the first data row down
+PUNCHES = [
+    (1, "REF-1", "Loose terminal", "QA", "PROD", "QA"),    # closed
+    (2, "REF-2", "Missing ferrule", "QA", "PROD", None),   # implemented, still open
+    (3, "REF-3", "Wrong label", None, None, None),         # open
+]
+
+
+def make_inspector(excel_path):
+    ins = quality.CircuitInspector.__new__(quality.CircuitInspector)
+    ins.excel_file = excel_path
+    ins.punch_sheet_name = "Punch Sheet"
+    ins.punch_cols = {
+        'sr_no': 'A', 'ref_no': 'B', 'desc': 'C', 'category': 'D',
+        'checked_name': 'E', 'checked_date': 'F',
+        'implemented_name': 'G', 'implemented_date': 'H',
+        'closed_name': 'I', 'closed_date': 'J',
+    }
+    ins._punch_col_idx = {k: openpyxl.utils.column_index_from_string(v) - 1
+                          for k, v in ins.punch_cols.items()}
+    ins._punches_cache = {}
+    ins._punch_desc_cache = {}
+    ins._open_count_cache = {}
+    return ins
+
+
+@pytest.fixture
+def punch_book(tmp_path):
+    path = str(tmp_path / "Emerson.xlsx")
+    shutil.copy(TEMPLATE, path)
+    wb = openpyxl.load_workbook(path)
+    ws = wb["Punch Sheet"]
+    first = quality.CircuitInspector._PUNCH_FIRST_ROW
+    for row, (sr, ref, desc, checked, impl, closed) in enumerate(PUNCHES, start=first):
+        ws.cell(row=row, column=1, value=sr)
+        ws.cell(row=row, column=2, value=ref)
+        ws.cell(row=row, column=3, value=desc)
+        ws.cell(row=row, column=4, value="Wiring")
+        ws.cell(row=row, column=5, value=checked)
+        ws.cell(row=row, column=7, value=impl)
+        ws.cell(row=row, column=9, value=closed)
+    wb.save(path)
+    wb.close()
+    return path
+
+
+def test_template_header_reads_empty_in_row_8():
+    # The sweeps rely on this: SR No is merged over A7:A8, so A8 has no value of its own
+    wb = openpyxl.load_workbook(TEMPLATE, read_only=True, data_only=True)
+    try:
+        ws = wb["Punch Sheet"]
+        row8 = next(ws.iter_rows(min_row=8, max_row=8, max_col=10, values_only=True))
+    finally:
+        wb.close()
+    assert row8[0] is None
+    assert row8[4] is not None
+
+
+def test_punchcounts(punch_book):
+    ins = make_inspector(punch_book)
+    assert ins.punchcounts(punch_book) == (3, 2, 1, 1)
+
+
+def test_countopen(punch_book):
+    ins = make_inspector(punch_book)
+    assert ins.countopen() == 2
+    # Second call is served from the stat-keyed cache
+    assert ins.countopen() == 2
+
+
+def test_openpuches(punch_book):
+    ins = make_inspector(punch_book)
+    punches = ins.openpuches()
+    assert [(p['row'], p['sr_no']) for p in punches] == [(10, 2), (11, 3)]
+    assert punches[0]['implemented'] is True
+    assert punches[1]['implemented'] is False
+
+
+def test_punchindex(punch_book):
+    ins = make_inspector(punch_book)
+    sr_rows, desc_rows, desc_norm = ins.punchindex()
+    assert sr_rows == [(9, 1), (10, 2), (11, 3)]
+    assert desc_rows == [9, 10, 11]
+    assert desc_norm == ["loose terminal", "missing ferrule", "wrong label"]
@@ -0,0 +1,59 @@
+"""openworkingxl()/saveworkingxl()/releaseworkingxl() hand-off of the cached editable workbook."""
+import os
+import shutil
+import threading
+import weakref
+from collections import OrderedDict
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("PIL")
+pytest.importorskip("fitz")
+pytest.importorskip("numpy")
+
+import quality  # noqa: E402
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Emerson.xlsx")
+
+
+@pytest.fixture
+def inspector(tmp_path):
+    path = str(tmp_path / "Emerson.xlsx")
+    shutil.copy(TEMPLATE, path)
+    ins = quality.CircuitInspector.__new__(quality.CircuitInspector)
+    ins.excel_file = path
+    ins._wb_cache = OrderedDict()
+    ins._wb_base_stat = weakref.WeakKeyDictionary()
+    ins._xl_lock = threading.RLock()
+    ins._punches_cache = {}
+    ins._punch_desc_cache = {}
+    ins._open_count_cache = {}
+    ins._interphase_status_cache = {}
+    return ins
+
+
+def touch_on_disk(path):
+    # Another writer: same workbook saved again, with a new mtime and size
+    wb = openpyxl.load_workbook(path)
+    wb["Punch Sheet"]["A9"] = 99
+    wb.save(path)
+    wb.close()
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_saved_workbook_is_reused(inspector):
+    wb = inspector.openworkingxl()
+    inspector.saveworkingxl(wb)
+    assert inspector.openworkingxl() is wb
+
+
+def test_release_after_external_change_drops_workbook(inspector):
+    wb = inspector.openworkingxl()
+    touch_on_disk(inspector.excel_file)
+    inspector.releaseworkingxl(wb)
+    assert not inspector._wb_cache
+    fresh = inspector.openworkingxl()
+    assert fresh is not wb
+    assert fresh["Punch Sheet"]["A9"].value == 99